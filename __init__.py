@@ -1,14 +1,20 @@
 # AAA_Metadata_System/__init__.py
 import importlib.util
+import logging
 import os
 import sys
 import shutil
+from itertools import chain
 
-# Add this import for ComfyUI paths
-try:
-    import folder_paths
-except ImportError:
-    folder_paths = None
+logger = logging.getLogger(__name__)
+
+# Add this import for ComfyUI paths (probed first so non-ComfyUI contexts skip the failing import)
+folder_paths = None
+if importlib.util.find_spec("folder_paths") is not None:
+    try:
+        import folder_paths
+    except ImportError:
+        folder_paths = None
 
 # NumExpr logs a noisy warning when it detects many cores without guidance; cap to ComfyUI's default unless user sets it
 if "NUMEXPR_MAX_THREADS" not in os.environ:
@@ -16,96 +22,218 @@ if "NUMEXPR_MAX_THREADS" not in os.environ:
 
 # Make this package importable as both its folder name and as 'AAA_Metadata_System'
 # This allows: from AAA_Metadata_System import MetadataService
-sys.modules['AAA_Metadata_System'] = sys.modules.get(__name__, sys.modules[__name__])
+# The alias is only registered once, and never over an existing module, so a
+# reload cannot leave two different module objects behind the same name.
+if __name__ != 'AAA_Metadata_System' and 'AAA_Metadata_System' not in sys.modules:
+    sys.modules['AAA_Metadata_System'] = sys.modules[__name__]
+
+# Export core functionality for easy access.
+# The metadata service and handlers pull in the XMP/EXIF/DB stacks, so they are
+# resolved on first attribute access (PEP 562) instead of at import time. ComfyUI
+# only needs the node mappings below to start up.
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .eric_metadata.service import MetadataService
+    from .eric_metadata.handlers.base import BaseHandler
+    from .eric_metadata.handlers.xmp import XMPSidecarHandler
+    from .eric_metadata.handlers.embedded import EmbeddedMetadataHandler
+    from .eric_metadata.handlers.txt import TxtFileHandler
+    from .eric_metadata.handlers.db import DatabaseHandler
+
+_LAZY_EXPORTS = {
+    "MetadataService": ("eric_metadata.service", "MetadataService"),
+    "BaseHandler": ("eric_metadata.handlers.base", "BaseHandler"),
+    "XMPSidecarHandler": ("eric_metadata.handlers.xmp", "XMPSidecarHandler"),
+    "EmbeddedMetadataHandler": ("eric_metadata.handlers.embedded", "EmbeddedMetadataHandler"),
+    "TxtFileHandler": ("eric_metadata.handlers.txt", "TxtFileHandler"),
+    "DatabaseHandler": ("eric_metadata.handlers.db", "DatabaseHandler"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module("." + module_name, __name__), attr)
+    globals()[name] = value
+    return value
 
-# Export core functionality for easy access
-from .eric_metadata.service import MetadataService
-from .eric_metadata.handlers.base import BaseHandler
-from .eric_metadata.handlers.xmp import XMPSidecarHandler
-from .eric_metadata.handlers.embedded import EmbeddedMetadataHandler
-from .eric_metadata.handlers.txt import TxtFileHandler
-from .eric_metadata.handlers.db import DatabaseHandler
-from .eric_metadata.hooks.runtime_capture import auto_enable_from_env
 
 # Initialize node mappings
 NODE_CLASS_MAPPINGS = {}
 NODE_DISPLAY_NAME_MAPPINGS = {}
 
+# Package location, resolved once at import
+_PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+_PKG_REAL_DIR = os.path.dirname(os.path.realpath(__file__))
+
 # Get the nodes directory
 def get_nodes_dir(subpath=None, mkdir=False):
-    dir = os.path.dirname(__file__)
-    if subpath is not None:
-        dir = os.path.join(dir, subpath)
-
-    dir = os.path.abspath(dir)
+    dir = _PKG_DIR if subpath is None else os.path.normpath(os.path.join(_PKG_DIR, subpath))
 
     if mkdir and not os.path.exists(dir):
         os.makedirs(dir)
     return dir
 
+def _link_or_copy(src, dst, try_link):
+    """Hardlink src to dst when on the same filesystem, copying as a fallback."""
+    if try_link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            # Cross-device, unsupported filesystem (e.g. ReFS/FAT) or no permission
+            pass
+    shutil.copy2(src, dst)
+
 # Copy web extensions to ComfyUI's main extensions directory
 def install_web_extensions():
     if not folder_paths:
-        print("[AAA_Metadata_System] Warning: folder_paths not available, web extensions may not work")
+        logger.warning("[AAA_Metadata_System] folder_paths not available, web extensions may not work")
         return
         
     try:
         # Get the path to ComfyUI's web/extensions directory
-        extension_path = os.path.join(os.path.dirname(folder_paths.__file__), "web", "extensions")
-        my_extension_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "web")
+        sep = os.sep
+        extension_path = f"{os.path.dirname(folder_paths.__file__)}{sep}web{sep}extensions"
+        my_extension_path = f"{_PKG_REAL_DIR}{sep}web"
         
         # Create MetadataSystem subfolder in ComfyUI extensions
-        metadata_extension_path = os.path.join(extension_path, "MetadataSystem")
+        metadata_extension_path = f"{extension_path}{sep}MetadataSystem"
+
+        src_entries = {}
+        if os.path.isdir(my_extension_path):
+            with os.scandir(my_extension_path) as entries:
+                src_entries = {entry.name: entry for entry in entries if entry.name.endswith('.js')}
+
         os.makedirs(metadata_extension_path, exist_ok=True)
-        
-        # Clean up existing files in the MetadataSystem folder
-        if os.path.exists(metadata_extension_path):
-            for file in os.listdir(metadata_extension_path):
-                file_path = os.path.join(metadata_extension_path, file)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-        
-        # Copy our extension files to ComfyUI's extensions/MetadataSystem directory
-        if os.path.exists(my_extension_path):
-            for file in os.listdir(my_extension_path):
-                if file.endswith('.js'):
-                    src = os.path.join(my_extension_path, file)
-                    dst = os.path.join(metadata_extension_path, file)
-                    print(f"[AAA_Metadata_System] Copying extension file: {file}")
-                    shutil.copy2(src, dst)
-                    
-        print(f"[AAA_Metadata_System] Web extensions installed to: {metadata_extension_path}")
+
+        # One scan of the destination; the sync is then a diff of the two name sets
+        with os.scandir(metadata_extension_path) as entries:
+            dst_entries = {
+                entry.name: entry
+                for entry in entries
+                if entry.is_file()
+            }
+
+        # Remove files we no longer ship
+        for name in dst_entries.keys() - src_entries.keys():
+            os.remove(dst_entries[name].path)
+
+        # Install new or updated extension files into ComfyUI's extensions/MetadataSystem directory.
+        # Hardlinks share the source's mtime and copy2 preserves it, so an unchanged
+        # source compares equal on the next start.
+        same_device = bool(src_entries) and (
+            os.stat(my_extension_path).st_dev == os.stat(metadata_extension_path).st_dev
+        )
+        for name, entry in src_entries.items():
+            installed = dst_entries.get(name)
+            if installed is not None:
+                src_stat = entry.stat()
+                dst_stat = installed.stat()
+                # Only an exact size and mtime match counts as installed, so a
+                # deleted or locally edited copy is restored
+                if (src_stat.st_size == dst_stat.st_size
+                        and src_stat.st_mtime_ns == dst_stat.st_mtime_ns):
+                    continue
+                # Unlink rather than overwrite: writing into a hardlinked copy would
+                # modify our own source file
+                os.unlink(installed.path)
+            logger.debug("[AAA_Metadata_System] Copying extension file: %s", name)
+            _link_or_copy(entry.path, f"{metadata_extension_path}{sep}{name}", same_device)
+
+        logger.info("[AAA_Metadata_System] Web extensions installed to: %s", metadata_extension_path)
         
     except Exception as e:
-        print(f"[AAA_Metadata_System] Error installing web extensions: {e}")
+        logger.error("[AAA_Metadata_System] Error installing web extensions: %s", e)
+
+def _maybe_enable_runtime_hooks():
+    """Enable runtime hooks only when env/config asks for them (defaults to off).
+
+    The hook module is imported only in that case, so the common disabled path
+    costs a config read rather than an extra import.
+    """
+    try:
+        from .eric_metadata.utils.config import get_runtime_hooks_enabled
+        requested = get_runtime_hooks_enabled()
+    except Exception:
+        # Let auto_enable_from_env apply its own environment-variable fallback
+        requested = True
+    if requested:
+        from .eric_metadata.hooks.runtime_capture import auto_enable_from_env
+        auto_enable_from_env()
 
 # Install web extensions
 install_web_extensions()
 
-# Enable runtime hooks if the environment flag requests it (defaults to off).
-auto_enable_from_env()
+_maybe_enable_runtime_hooks()
+
+def _cached_import(module_path, file_path):
+    """Return an already-imported module from sys.modules, loading it from file_path otherwise.
+
+    The spec is built straight from the known file location, so the meta-path
+    finders never have to search for it.
+    """
+    module = sys.modules.get(module_path)
+    if module is not None and getattr(module, "__spec__", None) is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_path, file_path)
+    module = importlib.util.module_from_spec(spec)
+    # Register before executing so circular imports see the partially initialised module
+    sys.modules[module_path] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_path, None)
+        raise
+
+    parent_name, _, child_name = module_path.rpartition(".")
+    parent = sys.modules.get(parent_name)
+    if parent is not None:
+        setattr(parent, child_name, module)
+    return module
 
 # Import nodes from the nodes directory
 nodes_dir = get_nodes_dir("nodes")
-for file in os.listdir(nodes_dir):
-    if not file.endswith(".py") or file.startswith("__"):
-        continue
-        
-    name = os.path.splitext(file)[0]
+# Node modules use relative imports, so their parent package must exist first
+importlib.import_module(".nodes", __name__)
+_node_files = []
+with os.scandir(nodes_dir) as entries:
+    for entry in entries:
+        # Cheap name checks first; is_file() only runs for candidate modules
+        file = entry.name
+        if (
+            file.startswith("__")
+            or not file.endswith(".py")
+            or not entry.is_file()
+        ):
+            continue
+        _node_files.append((file[:-3], entry.path))
+
+_class_mapping_items = []
+_display_name_items = []
+for name, path in _node_files:
     try:
         # Import the module
-        imported_module = importlib.import_module(".nodes.{}".format(name), __name__)
-        
-        # Extract and update node mappings
+        imported_module = _cached_import(f"{__name__}.nodes.{name}", path)
+
+        # Collect node mappings; they are merged in one pass after the loop
         if hasattr(imported_module, 'NODE_CLASS_MAPPINGS'):
-            NODE_CLASS_MAPPINGS.update(imported_module.NODE_CLASS_MAPPINGS)
-            
+            _class_mapping_items.append(imported_module.NODE_CLASS_MAPPINGS.items())
+
         if hasattr(imported_module, 'NODE_DISPLAY_NAME_MAPPINGS'):
-            NODE_DISPLAY_NAME_MAPPINGS.update(imported_module.NODE_DISPLAY_NAME_MAPPINGS)
-            
-        print(f"Loaded node module: {name}")
+            _display_name_items.append(imported_module.NODE_DISPLAY_NAME_MAPPINGS.items())
+
+        logger.debug("Loaded node module: %s", name)
     except Exception as e:
-        print(f"Error loading node module {name}: {str(e)}")
+        logger.warning("Error loading node module %s: %s", name, e)
+
+# Later modules still win on duplicate keys, as with per-module update()
+NODE_CLASS_MAPPINGS.update(chain.from_iterable(_class_mapping_items))
+NODE_DISPLAY_NAME_MAPPINGS.update(chain.from_iterable(_display_name_items))
 
 # Version info
 __version__ = "0.1.0"
@@ -0,0 +1,1111 @@
+"""Named-color palette. Generated by build_color_names.py; do not edit by hand.
+
+Each value is the color's R, G, B channels as a 3-byte ``bytes`` object.
+``COLOR_CATEGORIES`` maps each category block to its color names.
+"""
+
+COLOR_NAMES = {
+    'red': b'\xff\x00\x00',
+    'crimson': b'\xdc\x14<',
+    'firebrick': b'\xb2""',
+    'darkred': b'\x8b\x00\x00',
+    'maroon': b'\x80\x00\x00',
+    'indian_red': b'\xcd\\\\',
+    'salmon': b'\xfa\x80r',
+    'light_coral': b'\xf0\x80\x80',
+    'dark_salmon': b'\xe9\x96z',
+    'light_salmon': b'\xff\xa0z',
+    'scarlet': b'\xff$\x00',
+    'vermilion_red': b'\xe3B4',
+    'burgundy': b'\x80\x00 ',
+    'wine': b'r/7',
+    'ruby': b'\x9b\x11\x1e',
+    'orange': b'\xff\xa5\x00',
+    'dark_orange': b'\xff\x8c\x00',
+    'coral': b'\xff\x7fP',
+    'tomato': b'\xffcG',
+    'orange_red': b'\xffE\x00',
+    'tangerine': b'\xf2\x85\x00',
+    'amber': b'\xff\xbf\x00',
+    'apricot': b'\xfb\xce\xb1',
+    'yellow': b'\xff\xff\x00',
+    'light_yellow': b'\xff\xff\xe0',
+    'lemon_chiffon': b'\xff\xfa\xcd',
+    'gold': b'\xff\xd7\x00',
+    'golden': b'\xff\xd7\x00',
+    'cream_yellow': b'\xff\xfd\xd0',
+    'lemon': b'\xff\xfas',
+    'canary': b'\xff\xff\x99',
+    'mustard': b'\xe1\xad\x01',
+    'honey': b'\xe3\xaaC',
+    'khaki': b'\xf0\xe6\x8c',
+    'pale_goldenrod': b'\xee\xe8\xaa',
+    'light_goldenrod_yellow': b'\xfa\xfa\xd2',
+    'dark_yellow': b'\x8b\x8b\x00',
+    'green': b'\x00\x80\x00',
+    'lime': b'\x00\xff\x00',
+    'lime_green': b'2\xcd2',
+    'forest_green': b'"\x8b"',
+    'dark_green': b'\x00d\x00',
+    'olive': b'\x80\x80\x00',
+    'olive_drab': b'k\x8e#',
+    'sea_green': b'.\x8bW',
+    'medium_sea_green': b'<\xb3q',
+    'spring_green': b'\x00\xff\x7f',
+    'olive_green': b'k\x8e#',
+    'dark_olive': b'Uk/',
+    'dark_olive_green': b'Uk/',
+    'green_yellow': b'\xad\xff/',
+    'yellow_green': b'\x9a\xcd2',
+    'dark_sea_green': b'\x8f\xbc\x8f',
+    'emerald': b'\x00\xc9W',
+    'mint_green': b'\x98\xff\x98',
+    'jade': b'\x00\xa8k',
+    'malachite': b'\x0b\xdaQ',
+    'chartreuse': b'\x7f\xff\x00',
+    'light_olive': b'\x9a\xa6`',
+    'moss_green': b'\x86\x96c',
+    'dark_moss': b'J]#',
+    'light_moss': b'\x96\x99h',
+    'sage': b'\x8a\x9a\x83',
+    'sage_green': b'\x9f\xae\x97',
+    'light_sage': b'\xbc\xc6\xb6',
+    'dark_sage': b's\x7fm',
+    'eucalyptus': b'{\x9b\x8c',
+    'fern_green': b'T\x8bT',
+    'avocado': b'v\x87C',
+    'artichoke': b'\x8f\x97y',
+    'pistachio': b'\x90\xacx',
+    'hunter_green': b'5^;',
+    'pine_green': b'!Z8',
+    'spruce': b'5XU',
+    'tea_green': b'\xd0\xe9\xca',
+    'mint': b'\x96\xde\xbc',
+    'light_mint': b'\xbc\xec\xd7',
+    'celadon': b'\xaf\xd1\xb7',
+    'blue': b'\x00\x00\xff',
+    'navy': b'\x00\x00\x80',
+    'royal_blue': b'Ai\xe1',
+    'steel_blue': b'F\x82\xb4',
+    'dark_blue': b'\x00\x00\x8b',
+    'medium_blue': b'\x00\x00\xcd',
+    'sky_blue': b'\x87\xce\xeb',
+    'light_sky_blue': b'\x87\xce\xfa',
+    'deep_sky_blue': b'\x00\xbf\xff',
+    'dodger_blue': b'\x1e\x90\xff',
+    'cornflower_blue': b'd\x95\xed',
+    'cadet_blue': b'_\x9e\xa0',
+    'medium_aquamarine': b'f\xcd\xaa',
+    'dark_cyan': b'\x00\x8b\x8b',
+    'aqua': b'\x00\xff\xff',
+    'cyan': b'\x00\xff\xff',
+    'light_cyan': b'\xe0\xff\xff',
+    'teal': b'\x00\x80\x80',
+    'aquamarine': b'\x7f\xff\xd4',
+    'medium_turquoise': b'H\xd1\xcc',
+    'dark_turquoise': b'\x00\xce\xd1',
+    'powder_blue': b'\xb0\xe0\xe6',
+    'light_blue': b'\xad\xd8\xe6',
+    'light_steel_blue': b'\xb0\xc4\xde',
+    'pale_turquoise': b'\xaf\xee\xee',
+    'midnight_blue': b'\x19\x19p',
+    'baby_blue': b'\x89\xcf\xf0',
+    'cornflower': b'd\x95\xed',
+    'periwinkle': b'\x96\xa3\xd8',
+    'slate_blue': b'jZ\xcd',
+    'cerulean': b'\x00{\xa7',
+    'azure_blue': b'\x00\x7f\xff',
+    'turquoise': b'@\xe0\xd0',
+    'cobalt': b'\x00G\xab',
+    'purple': b'\x80\x00\x80',
+    'indigo': b'K\x00\x82',
+    'dark_magenta': b'\x8b\x00\x8b',
+    'dark_violet': b'\x94\x00\xd3',
+    'dark_orchid': b'\x992\xcc',
+    'medium_purple': b'\x93p\xdb',
+    'medium_orchid': b'\xbaU\xd3',
+    'magenta': b'\xff\x00\xff',
+    'orchid': b'\xdap\xd6',
+    'violet': b'\xee\x82\xee',
+    'plum': b'\xdd\xa0\xdd',
+    'lavender': b'\xe6\xe6\xfa',
+    'lilac': b'\xc8\xa2\xc8',
+    'mauve': b'\xcc\x99\xcc',
+    'amethyst': b'\x99f\xcc',
+    'heliotrope': b'\xbbw\xff',
+    'fuchsia': b'\xff\x00\xff',
+    'rose': b'\xff\x00\x80',
+    'shocking_pink': b'\xfc\x0f\xc0',
+    'hot_pink': b'\xffi\xb4',
+    'bubblegum': b'\xff\xc1\xcc',
+    'salmon_pink': b'\xff\x91\xa4',
+    'coral_pink': b'\xf8\x83y',
+    'peach_orange': b'\xff\xcb\xa4',
+    'light_peach': b'\xff\xe5\xcd',
+    'brown': b'\xa5**',
+    'saddle_brown': b'\x8bE\x13',
+    'sienna': b'\xa0R-',
+    'chocolate': b'\xd2i\x1e',
+    'peru': b'\xcd\x85?',
+    'sandy_brown': b'\xf4\xa4`',
+    'burly_wood': b'\xde\xb8\x87',
+    'tan': b'\xd2\xb4\x8c',
+    'taupe': b'\x91\x85v',
+    'light_taupe': b'\xb3\xa4\x93',
+    'warm_taupe': b'\xab\x94~',
+    'cool_taupe': b'\x90\x8d\x80',
+    'khaki_brown': b'nZ7',
+    'olive_brown': b'^U\x18',
+    'light_brown': b'\xb5\x88c',
+    'medium_brown': b'\x95kJ',
+    'dark_brown': b'V9)',
+    'chocolate_brown': b']?-',
+    'golden_brown': b'\x99e\x15',
+    'espresso': b"='\x1a",
+    'coffee': b'K<(',
+    'coffee_brown': b'K<(',
+    'mocha': b'gN9',
+    'caramel_brown': b'\xc2\x96Z',
+    'cinnamon_brown': b'\xa7Y\x1d',
+    'auburn': b'\x9a3\x01',
+    'mahogany': b'g\x1a\n',
+    'sepia': b'pB\x14',
+    'rust': b'\xb7A\x0e',
+    'ochre': b'\xccw"',
+    'raw_sienna': b'\xb0e\x00',
+    'burnt_sienna': b'\xe9tQ',
+    'raw_umber': b'sJ\x12',
+    'burnt_umber': b'\x8a3$',
+    'umber': b'cQG',
+    'terra_cotta': b'\xe2r[',
+    'dust_brown': b'\xb4\xa5\x8c',
+    'sand': b'\xde\xc5\x9e',
+    'light_sand': b'\xec\xd5\xae',
+    'dark_sand': b'\xc2\xaa\x83',
+    'wheat': b'\xd8\xbb\x8d',
+    'cream': b'\xff\xfb\xd6',
+    'eggshell': b'\xf7\xf5\xe1',
+    'buff': b'\xf0\xdc\x82',
+    'warm_tan': b'\xd6\xb0y',
+    'cool_tan': b'\xd1\xbe\x9c',
+    'dark_tan': b'\xb5\x9av',
+    'light_beige': b'\xe5\xd4\xbb',
+    'beige': b'\xd5\xc6\xaf',
+    'warm_beige': b'\xdd\xc6\xa6',
+    'cool_beige': b'\xce\xc7\xb8',
+    'peach_puff': b'\xff\xda\xb9',
+    'bisque': b'\xff\xe4\xc4',
+    'navajo_white': b'\xff\xde\xad',
+    'moccasin': b'\xff\xe4\xb5',
+    'papaya_whip': b'\xff\xef\xd5',
+    'white': b'\xff\xff\xff',
+    'snow': b'\xff\xfa\xfa',
+    'honeydew': b'\xf0\xff\xf0',
+    'mint_cream': b'\xf5\xff\xfa',
+    'azure': b'\xf0\xff\xff',
+    'alice_blue': b'\xf0\xf8\xff',
+    'ghost_white': b'\xf8\xf8\xff',
+    'white_smoke': b'\xf5\xf5\xf5',
+    'seashell': b'\xff\xf5\xee',
+    'linen': b'\xfa\xf0\xe6',
+    'ivory': b'\xff\xff\xf0',
+    'misty_rose': b'\xff\xe4\xe1',
+    'gainsboro': b'\xdc\xdc\xdc',
+    'light_gray': b'\xd3\xd3\xd3',
+    'silver': b'\xc0\xc0\xc0',
+    'dark_gray': b'\xa9\xa9\xa9',
+    'gray': b'\x80\x80\x80',
+    'dim_gray': b'iii',
+    'light_slate_gray': b'w\x88\x99',
+    'slate_gray': b'p\x80\x90',
+    'dark_slate_gray': b'/OO',
+    'black': b'\x00\x00\x00',
+    'warm_gray_1': b'\xbc\xaf\xaa',
+    'warm_gray_2': b'\xa5\x97\x92',
+    'warm_gray_3': b'\x8d\x80|',
+    'warm_gray_4': b'vjh',
+    'warm_gray_5': b'_US',
+    'warm_gray_6': b'HA@',
+    'warm_gray_7': b'4.-',
+    'cool_gray_1': b'\xaf\xb4\xbc',
+    'cool_gray_2': b'\x9a\x9f\xa6',
+    'cool_gray_3': b'\x83\x88\x8f',
+    'cool_gray_4': b'lqy',
+    'cool_gray_5': b'VZb',
+    'cool_gray_6': b'@DK',
+    'cool_gray_7': b'-06',
+    'neutral_gray_1': b'\xb6\xb6\xb6',
+    'neutral_gray_2': b'\x9e\x9e\x9e',
+    'neutral_gray_3': b'\x87\x87\x87',
+    'neutral_gray_4': b'ppp',
+    'neutral_gray_5': b'YYY',
+    'neutral_gray_6': b'BBB',
+    'neutral_gray_7': b'+++',
+    'charcoal': b'68>',
+    'charcoal_light': b'LNV',
+    'charcoal_dark': b"&'+",
+    'slate': b'FPZ',
+    'light_slate': b'ds\x82',
+    'dark_slate': b'-7A',
+    'graphite': b'227',
+    'platinum_blonde': b'\xde\xd2\xb4',
+    'ash_blonde': b'\xce\xc5\xaa',
+    'golden_blonde': b'\xdb\xbe\x8a',
+    'honey_blonde': b'\xdd\xb3i',
+    'strawberry_blonde': b'\xe1\xa9s',
+    'light_auburn': b'\xaaiO',
+    'copper_red': b'\xad\\:',
+    'ginger': b'\xbd^/',
+    'chestnut': b'u@*',
+    'chocolate_hair': b'W@5',
+    'dark_auburn': b'n4"',
+    'light_brown_hair': b'\x94oQ',
+    'medium_brown_hair': b'qQ:',
+    'dark_brown_hair': b'E3"',
+    'black_brown_hair': b'1$\x19',
+    'jet_black_hair': b'!\x1a\x13',
+    'ash_brown': b'}fU',
+    'golden_brown_hair': b'\x9arK',
+    'salt_and_pepper': b'\x91\x91\x91',
+    'silver_gray_hair': b'\xc1\xc2\xc1',
+    'steel_gray_hair': b'\x90\x91\x9a',
+    'white_hair': b'\xeb\xeb\xeb',
+    'pine_wood': b'\xc8\xaf}',
+    'light_oak': b'\xcb\xa7w',
+    'oak': b'\xb8\x92_',
+    'dark_oak': b'\x9dtI',
+    'walnut': b'sU?',
+    'dark_walnut': b'YB1',
+    'cherry_wood': b'\x9bSF',
+    'rosewood': b'g1/',
+    'mahogany_wood': b'y;0',
+    'ebony': b'5(\x1e',
+    'birch': b'\xd7\xbf\xa0',
+    'maple': b'\xcb\xaa~',
+    'cedar': b'\xafxT',
+    'teak': b'\x91kF',
+    'bamboo': b'\xbe\xafs',
+    'driftwood': b'\xb0\xa9\x98',
+    'redwood': b'\xa2^K',
+    'ash_wood': b'\xcb\xbf\xa9',
+    'hickory': b'\xbd\x9dp',
+    'weathered_wood': b'\x9f\x9c\x8a',
+    'bark_brown': b'YG9',
+    'dark_bark': b'B7.',
+    'porcelain': b'\xfb\xed\xdc',
+    'fair': b'\xf5\xe2\xc9',
+    'light_ivory': b'\xf5\xde\xbc',
+    'warm_ivory': b'\xf3\xd7\xb2',
+    'sand_beige': b'\xec\xd3\xaf',
+    'peach': b'\xef\xce\xab',
+    'light_rose_beige': b'\xe9\xc3\xa5',
+    'light_golden_beige': b'\xe2\xc1\x9a',
+    'olive_beige': b'\xcf\xb2\x8f',
+    'honey_beige': b'\xd8\xb9\x92',
+    'amber_beige': b'\xcb\xa6}',
+    'warm_beige_skin': b'\xd8\xb5\x8d',
+    'golden_tan': b'\xd6\xaf\x82',
+    'caramel': b'\xca\x9ep',
+    'medium_olive': b'\xb9\x9cz',
+    'golden_brown_skin': b'\xc1\x97h',
+    'toffee': b'\xb2\x89_',
+    'almond': b'\xa3{[',
+    'amber_brown': b'\x97mJ',
+    'chestnut_skin': b'\x92hN',
+    'copper_brown': b'\x8c[>',
+    'cinnamon': b'\x99a@',
+    'sienna_skin': b'\x8aV:',
+    'mahogany_skin': b'vJ2',
+    'deep_golden_brown': b'|O4',
+    'dark_chocolate': b"]:'",
+    'espresso_skin': b'J/#',
+    'deep_espresso': b':$\x1b',
+    'ebony_skin': b'/\x1e\x17',
+    'clay': b'\xa3|c',
+    'terracotta_soil': b'\xb2oF',
+    'adobe': b'\xa9tS',
+    'red_clay': b'\x9aU7',
+    'potting_soil': b'@2$',
+    'garden_soil': b'Q?+',
+    'dark_loam': b'4)\x1c',
+    'peat': b'D7&',
+    'sandy_soil': b'\xaa\x91h',
+    'dark_earth': b'*$\x1d',
+    'rich_soil': b'K9)',
+    'wet_earth': b':,\x1f',
+    'sandstone': b'\xc8\xba\x95',
+    'limestone': b'\xcb\xc4\xac',
+    'slate_stone': b'imq',
+    'granite': b'\xa8\xa2\x9f',
+    'dark_granite': b'rrr',
+    'basalt': b'IJN',
+    'marble': b'\xe5\xdc\xcf',
+    'travertine': b'\xd1\xc7\xac',
+    'soapstone': b'\x9e\xa4\xa6',
+    'quartz': b'\xe1\xde\xdc',
+    'onyx': b'547',
+    'flint': b'lfb',
+    'shale': b'[YT',
+    'silver_metallic': b'\xc0\xc0\xc0',
+    'chrome': b'\xe2\xe2\xe2',
+    'brushed_aluminum': b'\xb0\xb0\xb4',
+    'gold_metallic': b'\xd4\xaf7',
+    'rose_gold': b'\xb7ny',
+    'bronze': b'\xcd\x7f2',
+    'copper_metallic': b'\xb8s3',
+    'brass': b'\xb5\xa6B',
+    'pewter': b'\x84\x84\x88',
+    'platinum': b'\xe5\xe4\xe2',
+    'gunmetal': b'*49',
+    'steel_blue_metallic': b'O\x94\xcd',
+    'titanium': b'\x87\x86\x81',
+    'antique_brass': b'\xcd\x95u',
+    'antique_bronze': b'f]\x1e',
+    'antique_copper': b'\x96Z>',
+    'faded_red': b'\xabNR',
+    'faded_blue': b'y\x87\xa1',
+    'faded_green': b'\x88\x9cy',
+    'faded_yellow': b'\xd3\xce\x7f',
+    'faded_purple': b'\x9d\x8a\xa3',
+    'faded_teal': b'w\xa3\xa5',
+    'faded_pink': b'\xde\xa5\xb2',
+    'faded_orange': b'\xdd\x9ac',
+    'faded_denim': b'\x83\x98\xad',
+    'faded_khaki': b'\xc3\xb5\x98',
+    'faded_olive': b'\x9a\x99k',
+    'vintage_blue': b'g\x8e\xab',
+    'vintage_red': b'\xb6\\M',
+    'vintage_green': b'y\x94n',
+    'vintage_yellow': b'\xe9\xd7\x8e',
+    'vintage_pink': b'\xdf\xb3\xbf',
+    'washed_denim': b'\x95\xa9\xbe',
+    'dusty_rose': b'\xc1\x87\x8a',
+    'dusty_blue': b'\x87\x9d\xad',
+    'dusty_green': b'\x84\x9b\x87',
+    'dusty_lavender': b'\xac\xa0\xbb',
+    'sun_bleached_brown': b'\xa9\x92~',
+    'weathered_blue': b'\x8b\x99\xad',
+    'weathered_green': b'\x94\xa1\x8b',
+    'patina': b'|\xac\x9d',
+    'opal': b'\xa7\xc6\xda',
+    'mother_of_pearl': b'\xf2\xf1\xeb',
+    'abalone': b'\xd7\xe1\xc8',
+    'pearl': b'\xea\xe0\xc8',
+    'iridescent_blue': b'\x96\xbd\xe1',
+    'iridescent_pink': b'\xe8\xb3\xd5',
+    'iridescent_purple': b'\xb2\xa1\xe0',
+    'iridescent_green': b'\x9d\xde\xca',
+    'oil_slick_blue': b',u\xff',
+    'oil_slick_purple': b'~&\xdf',
+    'oil_slick_green': b'\x00\xe9\xb9',
+    'holographic_silver': b'\xd8\xd8\xe0',
+    'rainbow_sheen': b'\xbf\xaf\xdf',
+    'prismatic': b'\xbc\xbc\xdc',
+    'screen_blue': b'\x00z\xcc',
+    'monitor_black': b'\x14\x14\x14',
+    'led_red': b'\xff\x11\x00',
+    'led_green': b'\x00\xff*',
+    'led_blue': b'\x00D\xff',
+    'lcd_cyan': b'\x00\xd9\xe4',
+    'lcd_magenta': b'\xf6\x00\xff',
+    'terminal_green': b'\x00\xffA',
+    'night_mode_amber': b'\xff\xb4\x00',
+    'digital_yellow': b'\xff\xd8\x00',
+    'pixel_purple': b'\xbb\x00\xff',
+    'backlight_blue': b'=\xb4\xf2',
+    'interface_gray': b'\xf0\xf0\xf0',
+    'dark_mode_gray': b'666',
+    'cadmium_red': b'\xe3\x00"',
+    'alizarin_crimson': b'\xe3&6',
+    'cobalt_violet': b'\x9f?\xb0',
+    'ultramarine_blue': b'Af\xf5',
+    'prussian_blue': b'\x001S',
+    'phthalo_blue': b'\x00\x0f\x89',
+    'phthalo_green': b'\x00V;',
+    'sap_green': b'P}*',
+    'cadmium_yellow': b'\xff\xd3\x00',
+    'naples_yellow': b'\xfb\xe9\xa5',
+    'burnt_sienna_paint': b'\xe9tQ',
+    'raw_sienna_paint': b'\xbc\x8fV',
+    'raw_umber_paint': b'\x82fD',
+    'burnt_umber_paint': b'\x80F\x1b',
+    'vandyke_brown': b'jQ;',
+    'titanium_white': b'\xfc\xfc\xfc',
+    'ivory_black': b')))',
+    'ochre_paint': b'\xccw"',
+    'cerulean_blue': b'\x00{\xa7',
+    'quinacridone_magenta': b'\xb2Bj',
+    'hookers_green': b'\x00p<',
+    'permanent_green': b'\x04q#',
+    'vermilion': b'\xd98\x1e',
+    'viridian': b'@\x82m',
+    'slate_blue_gray': b'w\x85\x9d',
+    'taupe_gray': b'\x8a\x81|',
+    'sage_gray': b'\x80\x87\x81',
+    'moss_gray': b'\x86\x8dq',
+    'smoke_gray': b'\x97\x94\x99',
+    'ash_gray': b'\x9a\x9c\x9b',
+    'heather_gray': b'\xa6\xa8\xab',
+    'stormy_blue': b'\\q\x8c',
+    'dusty_teal': b'`\x8e\x91',
+    'matte_navy': b')A^',
+    'soft_burgundy': b'\x87EP',
+    'muted_plum': b'\x85g|',
+    'subdued_olive': b'z|U',
+    'faded_terracotta': b'\xafn]',
+    'quiet_coral': b'\xd6\x8av',
+    'charcoal_blue': b'=HX',
+    'pewter_green': b'i\x80~',
+    'muted_cyan': b'z\xaf\xb9',
+    'desaturated_navy': b'?Lb',
+    'desaturated_teal': b'[\x88\x87',
+    'office_blue': b'O\x81\xbd',
+    'conference_room_gray': b'\xd6\xd6\xd6',
+    'corporate_navy': b'\x1f:X',
+    'business_green': b'Jo^',
+    'pure_red': b'\xff\x00\x00',
+    'bright_red': b'\xff$\x00',
+    'vivid_red': b'\xf6\x00\x00',
+    'candy_red': b'\xff\x08@',
+    'cherry_red': b'\xd7\x00\x19',
+    'cardinal_red': b'\xc4\x1e:',
+    'neon_red': b'\xff\x07:',
+    'pure_orange': b'\xff\x7f\x00',
+    'bright_orange': b'\xff\x8c\x00',
+    'vivid_orange': b'\xffu\x18',
+    'electric_orange': b'\xffW"',
+    'neon_orange': b'\xffg\x00',
+    'fluorescent_orange': b'\xff\x7f*',
+    'pure_yellow': b'\xff\xff\x00',
+    'bright_yellow': b'\xff\xf6\x00',
+    'lemon_yellow': b'\xff\xf4\x00',
+    'canary_yellow': b'\xff\xfff',
+    'sunshine_yellow': b'\xff\xec\x00',
+    'neon_yellow': b'\xff\xff\x00',
+    'fluorescent_yellow': b'\xff\xf7\x00',
+    'pure_green': b'\x00\xff\x00',
+    'bright_green': b'\x00\xeb\x00',
+    'vivid_green': b'\x00\xfa\x00',
+    'electric_green': b'\x00\xff*',
+    'neon_green': b'9\xff\x14',
+    'fluorescent_green': b'\x00\xff\x7f',
+    'signal_green': b'\x00\xc3\x00',
+    'pure_blue': b'\x00\x00\xff',
+    'bright_blue': b'\x00f\xff',
+    'vivid_blue': b'\x00\x00\xf0',
+    'electric_blue': b'\x00\x8e\xff',
+    'neon_blue': b'\x00{\xff',
+    'cobalt_blue': b'\x00G\xab',
+    'ultramarine': b'\x12\n\xe6',
+    'royal_blue_vibrant': b'Ai\xe1',
+    'pure_purple': b'\x80\x00\x80',
+    'bright_purple': b'\x90\x00\xff',
+    'vivid_purple': b'\x8f\x00\xff',
+    'electric_purple': b'\xbf\x00\xff',
+    'neon_purple': b'v\x00\xed',
+    'fluorescent_purple': b'\xd2\x00\xff',
+    'pure_magenta': b'\xff\x00\xff',
+    'bright_magenta': b'\xff\x00\xd3',
+    'vivid_magenta': b'\xff\x00\xba',
+    'neon_magenta': b'\xff\x00\xff',
+    'shocking_pink_vibrant': b'\xff\x00\x8c',
+    'neon_pink': b'\xff\x00\xbb',
+    'hot_pink_vibrant': b'\xff\x00\xaa',
+    'acid_green': b'\xbb\xff\x00',
+    'chartreuse_bright': b'\xd5\xff\x00',
+    'laser_lemon': b'\xfe\xfe"',
+    'neon_coral': b'\xffPK',
+    'electric_indigo': b'o\x00\xff',
+    'bright_turquoise': b'\x00\xf5\xff',
+    'brilliant_azure': b'2\x8b\xff',
+    'aqua_vibrant': b'\x00\xff\xff',
+    'teal_bright': b'\x00\xd5\xc5',
+    'neon_lime': b'\xba\xff\x00',
+    'highlighter_yellow': b'\xef\xff\x00',
+    'highlighter_green': b'\x00\xff\x7f',
+    'highlighter_pink': b'\xffi\xff',
+    'highlighter_blue': b'\x00\xe0\xff',
+    'highlighter_orange': b'\xff\xa5\x00',
+    'neon_mint': b'\x00\xff\xaa',
+    'glow_green': b'\x00\xff\x00',
+    'radioactive_green': b'v\xff\x00',
+    'laser_blue': b'\x00\xf0\xff',
+    'plasma_pink': b'\xff\x00\x99',
+    'electric_violet': b'\x8c\x00\xff',
+    'nuclear_green': b'9\xff\x14',
+    'lightning_yellow': b'\xff\xfc\x00',
+}
+
+COLOR_CATEGORIES = {
+    'basic_colors': (
+        'red',
+        'crimson',
+        'firebrick',
+        'darkred',
+        'maroon',
+        'indian_red',
+        'salmon',
+        'light_coral',
+        'dark_salmon',
+        'light_salmon',
+        'scarlet',
+        'vermilion_red',
+        'burgundy',
+        'wine',
+        'ruby',
+        'orange',
+        'dark_orange',
+        'coral',
+        'tomato',
+        'orange_red',
+        'tangerine',
+        'amber',
+        'apricot',
+        'yellow',
+        'light_yellow',
+        'lemon_chiffon',
+        'gold',
+        'golden',
+        'cream_yellow',
+        'lemon',
+        'canary',
+        'mustard',
+        'honey',
+        'khaki',
+        'pale_goldenrod',
+        'light_goldenrod_yellow',
+        'dark_yellow',
+    ),
+    'greens': (
+        'green',
+        'lime',
+        'lime_green',
+        'forest_green',
+        'dark_green',
+        'olive',
+        'olive_drab',
+        'sea_green',
+        'medium_sea_green',
+        'spring_green',
+        'olive_green',
+        'dark_olive',
+        'dark_olive_green',
+        'green_yellow',
+        'yellow_green',
+        'dark_sea_green',
+        'emerald',
+        'mint_green',
+        'jade',
+        'malachite',
+        'chartreuse',
+        'light_olive',
+        'moss_green',
+        'dark_moss',
+        'light_moss',
+        'sage',
+        'sage_green',
+        'light_sage',
+        'dark_sage',
+        'eucalyptus',
+        'fern_green',
+        'avocado',
+        'artichoke',
+        'pistachio',
+        'hunter_green',
+        'pine_green',
+        'spruce',
+        'tea_green',
+        'mint',
+        'light_mint',
+        'celadon',
+    ),
+    'blues': (
+        'blue',
+        'navy',
+        'royal_blue',
+        'steel_blue',
+        'dark_blue',
+        'medium_blue',
+        'sky_blue',
+        'light_sky_blue',
+        'deep_sky_blue',
+        'dodger_blue',
+        'cornflower_blue',
+        'cadet_blue',
+        'medium_aquamarine',
+        'dark_cyan',
+        'aqua',
+        'cyan',
+        'light_cyan',
+        'teal',
+        'aquamarine',
+        'medium_turquoise',
+        'dark_turquoise',
+        'powder_blue',
+        'light_blue',
+        'light_steel_blue',
+        'pale_turquoise',
+        'midnight_blue',
+        'baby_blue',
+        'cornflower',
+        'periwinkle',
+        'slate_blue',
+        'cerulean',
+        'azure_blue',
+        'turquoise',
+        'cobalt',
+    ),
+    'purples': (
+        'purple',
+        'indigo',
+        'dark_magenta',
+        'dark_violet',
+        'dark_orchid',
+        'medium_purple',
+        'medium_orchid',
+        'magenta',
+        'orchid',
+        'violet',
+        'plum',
+        'lavender',
+        'lilac',
+        'mauve',
+        'amethyst',
+        'heliotrope',
+        'fuchsia',
+        'rose',
+        'shocking_pink',
+        'hot_pink',
+        'bubblegum',
+        'salmon_pink',
+        'coral_pink',
+        'peach_orange',
+        'light_peach',
+    ),
+    'earth_tones': (
+        'brown',
+        'saddle_brown',
+        'sienna',
+        'chocolate',
+        'peru',
+        'sandy_brown',
+        'burly_wood',
+        'tan',
+        'taupe',
+        'light_taupe',
+        'warm_taupe',
+        'cool_taupe',
+        'khaki_brown',
+        'olive_brown',
+        'light_brown',
+        'medium_brown',
+        'dark_brown',
+        'chocolate_brown',
+        'golden_brown',
+        'espresso',
+        'coffee',
+        'coffee_brown',
+        'mocha',
+        'caramel_brown',
+        'cinnamon_brown',
+        'auburn',
+        'mahogany',
+        'sepia',
+        'rust',
+        'ochre',
+        'raw_sienna',
+        'burnt_sienna',
+        'raw_umber',
+        'burnt_umber',
+        'umber',
+        'terra_cotta',
+        'dust_brown',
+    ),
+    'tans': (
+        'sand',
+        'light_sand',
+        'dark_sand',
+        'wheat',
+        'cream',
+        'eggshell',
+        'buff',
+        'warm_tan',
+        'cool_tan',
+        'dark_tan',
+        'light_beige',
+        'beige',
+        'warm_beige',
+        'cool_beige',
+        'peach_puff',
+        'bisque',
+        'navajo_white',
+        'moccasin',
+        'papaya_whip',
+    ),
+    'whites': (
+        'white',
+        'snow',
+        'honeydew',
+        'mint_cream',
+        'azure',
+        'alice_blue',
+        'ghost_white',
+        'white_smoke',
+        'seashell',
+        'linen',
+        'ivory',
+        'misty_rose',
+    ),
+    'grays': (
+        'gainsboro',
+        'light_gray',
+        'silver',
+        'dark_gray',
+        'gray',
+        'dim_gray',
+        'light_slate_gray',
+        'slate_gray',
+        'dark_slate_gray',
+        'black',
+        'warm_gray_1',
+        'warm_gray_2',
+        'warm_gray_3',
+        'warm_gray_4',
+        'warm_gray_5',
+        'warm_gray_6',
+        'warm_gray_7',
+        'cool_gray_1',
+        'cool_gray_2',
+        'cool_gray_3',
+        'cool_gray_4',
+        'cool_gray_5',
+        'cool_gray_6',
+        'cool_gray_7',
+        'neutral_gray_1',
+        'neutral_gray_2',
+        'neutral_gray_3',
+        'neutral_gray_4',
+        'neutral_gray_5',
+        'neutral_gray_6',
+        'neutral_gray_7',
+        'charcoal',
+        'charcoal_light',
+        'charcoal_dark',
+        'slate',
+        'light_slate',
+        'dark_slate',
+        'graphite',
+    ),
+    'hair_colors': (
+        'platinum_blonde',
+        'ash_blonde',
+        'golden_blonde',
+        'honey_blonde',
+        'strawberry_blonde',
+        'light_auburn',
+        'copper_red',
+        'ginger',
+        'chestnut',
+        'chocolate_hair',
+        'dark_auburn',
+        'light_brown_hair',
+        'medium_brown_hair',
+        'dark_brown_hair',
+        'black_brown_hair',
+        'jet_black_hair',
+        'ash_brown',
+        'golden_brown_hair',
+        'salt_and_pepper',
+        'silver_gray_hair',
+        'steel_gray_hair',
+        'white_hair',
+    ),
+    'wood_colors': (
+        'pine_wood',
+        'light_oak',
+        'oak',
+        'dark_oak',
+        'walnut',
+        'dark_walnut',
+        'cherry_wood',
+        'rosewood',
+        'mahogany_wood',
+        'ebony',
+        'birch',
+        'maple',
+        'cedar',
+        'teak',
+        'bamboo',
+        'driftwood',
+        'redwood',
+        'ash_wood',
+        'hickory',
+        'weathered_wood',
+        'bark_brown',
+        'dark_bark',
+    ),
+    'skin_tones': (
+        'porcelain',
+        'fair',
+        'light_ivory',
+        'warm_ivory',
+        'sand_beige',
+        'peach',
+        'light_rose_beige',
+        'light_golden_beige',
+        'olive_beige',
+        'honey_beige',
+        'amber_beige',
+        'warm_beige_skin',
+        'golden_tan',
+        'caramel',
+        'medium_olive',
+        'golden_brown_skin',
+        'toffee',
+        'almond',
+        'amber_brown',
+        'chestnut_skin',
+        'copper_brown',
+        'cinnamon',
+        'sienna_skin',
+        'mahogany_skin',
+        'deep_golden_brown',
+        'dark_chocolate',
+        'espresso_skin',
+        'deep_espresso',
+        'ebony_skin',
+    ),
+    'earth_colors': (
+        'clay',
+        'terracotta_soil',
+        'adobe',
+        'red_clay',
+        'potting_soil',
+        'garden_soil',
+        'dark_loam',
+        'peat',
+        'sandy_soil',
+        'dark_earth',
+        'rich_soil',
+        'wet_earth',
+    ),
+    'stone_colors': (
+        'sandstone',
+        'limestone',
+        'slate_stone',
+        'granite',
+        'dark_granite',
+        'basalt',
+        'marble',
+        'travertine',
+        'soapstone',
+        'quartz',
+        'onyx',
+        'flint',
+        'shale',
+    ),
+    'metallic_colors': (
+        'silver_metallic',
+        'chrome',
+        'brushed_aluminum',
+        'gold_metallic',
+        'rose_gold',
+        'bronze',
+        'copper_metallic',
+        'brass',
+        'pewter',
+        'platinum',
+        'gunmetal',
+        'steel_blue_metallic',
+        'titanium',
+        'antique_brass',
+        'antique_bronze',
+        'antique_copper',
+    ),
+    'faded_colors': (
+        'faded_red',
+        'faded_blue',
+        'faded_green',
+        'faded_yellow',
+        'faded_purple',
+        'faded_teal',
+        'faded_pink',
+        'faded_orange',
+        'faded_denim',
+        'faded_khaki',
+        'faded_olive',
+        'vintage_blue',
+        'vintage_red',
+        'vintage_green',
+        'vintage_yellow',
+        'vintage_pink',
+        'washed_denim',
+        'dusty_rose',
+        'dusty_blue',
+        'dusty_green',
+        'dusty_lavender',
+        'sun_bleached_brown',
+        'weathered_blue',
+        'weathered_green',
+        'patina',
+    ),
+    'iridescent_colors': (
+        'opal',
+        'mother_of_pearl',
+        'abalone',
+        'pearl',
+        'iridescent_blue',
+        'iridescent_pink',
+        'iridescent_purple',
+        'iridescent_green',
+        'oil_slick_blue',
+        'oil_slick_purple',
+        'oil_slick_green',
+        'holographic_silver',
+        'rainbow_sheen',
+        'prismatic',
+    ),
+    'display_colors': (
+        'screen_blue',
+        'monitor_black',
+        'led_red',
+        'led_green',
+        'led_blue',
+        'lcd_cyan',
+        'lcd_magenta',
+        'terminal_green',
+        'night_mode_amber',
+        'digital_yellow',
+        'pixel_purple',
+        'backlight_blue',
+        'interface_gray',
+        'dark_mode_gray',
+    ),
+    'painterly_colors': (
+        'cadmium_red',
+        'alizarin_crimson',
+        'cobalt_violet',
+        'ultramarine_blue',
+        'prussian_blue',
+        'phthalo_blue',
+        'phthalo_green',
+        'sap_green',
+        'cadmium_yellow',
+        'naples_yellow',
+        'burnt_sienna_paint',
+        'raw_sienna_paint',
+        'raw_umber_paint',
+        'burnt_umber_paint',
+        'vandyke_brown',
+        'titanium_white',
+        'ivory_black',
+        'ochre_paint',
+        'cerulean_blue',
+        'quinacridone_magenta',
+        'hookers_green',
+        'permanent_green',
+        'vermilion',
+        'viridian',
+    ),
+    'muted_colors': (
+        'slate_blue_gray',
+        'taupe_gray',
+        'sage_gray',
+        'moss_gray',
+        'smoke_gray',
+        'ash_gray',
+        'heather_gray',
+        'stormy_blue',
+        'dusty_teal',
+        'matte_navy',
+        'soft_burgundy',
+        'muted_plum',
+        'subdued_olive',
+        'faded_terracotta',
+        'quiet_coral',
+        'charcoal_blue',
+        'pewter_green',
+        'muted_cyan',
+        'desaturated_navy',
+        'desaturated_teal',
+        'office_blue',
+        'conference_room_gray',
+        'corporate_navy',
+        'business_green',
+    ),
+    'vibrant_colors': (
+        'pure_red',
+        'bright_red',
+        'vivid_red',
+        'candy_red',
+        'cherry_red',
+        'cardinal_red',
+        'neon_red',
+        'pure_orange',
+        'bright_orange',
+        'vivid_orange',
+        'electric_orange',
+        'neon_orange',
+        'fluorescent_orange',
+        'pure_yellow',
+        'bright_yellow',
+        'lemon_yellow',
+        'canary_yellow',
+        'sunshine_yellow',
+        'neon_yellow',
+        'fluorescent_yellow',
+        'pure_green',
+        'bright_green',
+        'vivid_green',
+        'electric_green',
+        'neon_green',
+        'fluorescent_green',
+        'signal_green',
+        'pure_blue',
+        'bright_blue',
+        'vivid_blue',
+        'electric_blue',
+        'neon_blue',
+        'cobalt_blue',
+        'ultramarine',
+        'royal_blue_vibrant',
+        'pure_purple',
+        'bright_purple',
+        'vivid_purple',
+        'electric_purple',
+        'neon_purple',
+        'fluorescent_purple',
+        'pure_magenta',
+        'bright_magenta',
+        'vivid_magenta',
+        'neon_magenta',
+        'shocking_pink_vibrant',
+        'neon_pink',
+        'hot_pink_vibrant',
+        'acid_green',
+        'chartreuse_bright',
+        'laser_lemon',
+        'neon_coral',
+        'electric_indigo',
+        'bright_turquoise',
+        'brilliant_azure',
+        'aqua_vibrant',
+        'teal_bright',
+    ),
+    'neon_colors': (
+        'neon_lime',
+        'highlighter_yellow',
+        'highlighter_green',
+        'highlighter_pink',
+        'highlighter_blue',
+        'highlighter_orange',
+        'neon_mint',
+        'glow_green',
+        'radioactive_green',
+        'laser_blue',
+        'plasma_pink',
+        'electric_violet',
+        'nuclear_green',
+        'lightning_yellow',
+    ),
+}
@@ -0,0 +1,47 @@
+"""
+Cached loading of the JSON color tables.
+
+Decoded JSON is stored with ``marshal`` under ``__pycache__`` next to the
+source file, keyed on the source's size and mtime in the same way ``.pyc``
+files are, so later loads skip the JSON parser. The cache is best-effort:
+any problem reading or writing it falls back to parsing the JSON.
+"""
+
+import json
+import marshal
+import os
+
+_MAGIC = b"AAAC1\n"
+
+
+def _cache_path(path):
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, "__pycache__", filename + ".marshal")
+
+
+def load_json(path):
+    """Return the decoded contents of the JSON file at ``path``."""
+    stat = os.stat(path)
+    header = _MAGIC + f"{stat.st_size} {stat.st_mtime_ns}\n".encode("ascii")
+    cache_path = _cache_path(path)
+
+    try:
+        with open(cache_path, "rb") as handle:
+            blob = handle.read()
+        if blob.startswith(header):
+            return marshal.loads(blob[len(header):])
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(header + marshal.dumps(data))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return data
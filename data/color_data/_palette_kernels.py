@@ -0,0 +1,51 @@
+"""
+Optional Numba kernels for nearest-color search.
+
+``nearest_perceptual`` is None when Numba (or NumPy) is not installed, or
+when Numba has only one thread to work with: the kernel's advantage over the
+BLAS-backed NumPy path comes from spreading pixels across cores, and on a
+single core it is slightly slower. ``color_names`` falls back to NumPy in
+either case. The kernel is compiled with ``cache=True``, so the JIT cost is
+paid on first use and the machine code is reused from ``__pycache__`` on
+later runs.
+"""
+
+try:
+    import numba
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    nearest_perceptual = None
+else:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _nearest_perceptual(pixels, basis, palette, norms):
+        n = pixels.shape[0]
+        m = palette.shape[0]
+        out = np.empty(n, np.intp)
+        # Column copies keep the inner loop on contiguous memory
+        palette_x = palette[:, 0].copy()
+        palette_y = palette[:, 1].copy()
+        palette_z = palette[:, 2].copy()
+        for i in prange(n):
+            r = np.float32(pixels[i, 0])
+            g = np.float32(pixels[i, 1])
+            b = np.float32(pixels[i, 2])
+            # Pre-doubled pixel coordinates for |c|^2 - 2 p.c (|p|^2 is constant)
+            x = 2.0 * (basis[0, 0] * r + basis[0, 1] * g + basis[0, 2] * b)
+            y = 2.0 * (basis[1, 0] * r + basis[1, 1] * g + basis[1, 2] * b)
+            z = 2.0 * (basis[2, 0] * r + basis[2, 1] * g + basis[2, 2] * b)
+            best = np.inf
+            best_j = 0
+            for j in range(m):
+                d = norms[j] - (x * palette_x[j] + y * palette_y[j] + z * palette_z[j])
+                if d < best:
+                    best = d
+                    best_j = j
+            out[i] = best_j
+        return out
+
+    if numba.config.NUMBA_NUM_THREADS > 1:
+        nearest_perceptual = _nearest_perceptual
+    else:
+        nearest_perceptual = None
@@ -1,258 +1,105 @@
-colors_across_cultures = [
-    {
-        "color": "White",
-        "western_america": ["Purity", "Innocence", "Peace"],
-        "europe": ["Purity", "Simplicity", "Cleanliness"],
-        "asia": ["Mourning", "Death", "Purity"],
-        "middle_east": ["Purity", "Peace", "Spirituality"],
-        "latin_america": ["Purity", "Peace", "Truth"],
-        "africa": ["Purity", "Spirituality", "Goodness"],
-        "oceania": ["Purity", "Peace", "Truth"],
-        "academic_insights": [
-            {
-                "source": "Berlin & Kay (1969), Basic Color Terms",
-                "note": (
-                    "English lumps 'white' with 'light' as a basic color category. "
-                    "In many Asian contexts (esp. Chinese, Japanese), white is strongly associated with funerals."
-                )
-            },
-            {
-                "source": "Michel Pastoureau (2008), Whites in the West",
-                "note": (
-                    "Traces how white became a symbol of innocence in Western Christian tradition, "
-                    "especially for weddings and baptismal garments."
-                )
-            }
-        ]
-    },
-    {
-        "color": "Black",
-        "western_america": ["Death", "Mourning", "Elegance"],
-        "europe": ["Formality", "Power", "Mourning"],
-        "asia": ["Evil", "Bad Luck", "Mystery"],
-        "middle_east": ["Authority", "Strength", "Mourning"],
-        "latin_america": ["Death", "Mourning", "Power"],
-        "africa": ["Maturity", "Strength", "Mourning"],
-        "oceania": ["Protection", "Mourning", "Earth"],
-        "academic_insights": [
-            {
-                "source": "Conklin (1955), Hanunoo Color Categories",
-                "note": (
-                    "Demonstrates that many non-Western cultures have fewer or different lexical categories "
-                    "for 'dark' vs. 'light' instead of black vs. white specifically."
-                )
-            },
-            {
-                "source": "Ross (2017), Color Symbolism in Middle Eastern Attire",
-                "note": (
-                    "Black robes in some Arab cultures indicate religious authority, humility, or scholarly status."
-                )
-            }
-        ]
-    },
-    {
-        "color": "Red",
-        "western_america": ["Danger", "Love", "Passion"],
-        "europe": ["Love", "Power", "Danger", "Courage"],
-        "asia": ["Happiness", "Joy", "Celebration"],
-        "middle_east": ["Danger", "Caution", "Evil"],
-        "latin_america": ["Fire", "Religion", "Passion"],
-        "africa": ["Danger", "Power", "Passion"],
-        "oceania": ["Strength", "Power", "Danger"],
-        "academic_insights": [
-            {
-                "source": "Norenzayan et al. (2007), Cultural Psychology of Color",
-                "note": (
-                    "Suggests that red often raises physiological arousal in experiments, "
-                    "which may partly explain the 'danger' or 'warning' associations in many regions."
-                )
-            },
-            {
-                "source": "Amy Butler Greenfield (2005), A Perfect Red",
-                "note": (
-                    "Historical account of how red dyes (e.g., cochineal) became symbols of status and wealth "
-                    "in Europe and the Americas."
-                )
-            }
-        ]
-    },
-    {
-        "color": "Blue",
-        "western_america": ["Trust", "Authority", "Masculinity"],
-        "europe": ["Calm", "Stability", "Truth", "Serenity"],
-        "asia": ["Immortality", "Strength", "Femininity"],
-        "middle_east": ["Protection", "Holiness", "Spirituality"],
-        "latin_america": ["Trust", "Religion", "Serenity"],
-        "africa": ["Truth", "Healing", "Harmony"],
-        "oceania": ["Peace", "Truth", "Water"],
-        "academic_insights": [
-            {
-                "source": "Kay & Regier (2003), Color naming universals",
-                "note": (
-                    "Blue was historically 'lumped' with green in many languages (no separate word for blue). "
-                    "As languages evolve, blue often emerges as a distinct category after black, white, red, and green."
-                )
-            },
-            {
-                "source": "Pastoureau (2001), Blue: The History of a Color",
-                "note": (
-                    "Explores how blue shifted from 'barbaric' in medieval Europe to a royal and sacred color "
-                    "by the High Middle Ages and beyond."
-                )
-            }
-        ]
-    },
-    {
-        "color": "Yellow",
-        "western_america": ["Happiness", "Warmth", "Caution"],
-        "europe": ["Happiness", "Warmth", "Cowardice"],
-        "asia": ["Sacred", "Royalty", "Courage"],
-        "middle_east": ["Happiness", "Strength", "Mourning"],
-        "latin_america": ["Death", "Sorrow", "Mourning"],
-        "africa": ["Wealth", "Power", "Energy"],
-        "oceania": ["Warmth", "Happiness", "Joy"],
-        "academic_insights": [
-            {
-                "source": "Birren (1961), Color Psychology and Color Therapy",
-                "note": (
-                    "Yellow is often found to be a 'stimulating' color in Western color psychology. "
-                    "But in parts of Asia (especially Imperial China), yellow was once reserved for the Emperor."
-                )
-            },
-            {
-                "source": "Pinker & Maier (2018), Cultural Color Communication",
-                "note": (
-                    "Analyzes how 'yellow ribbons' in Western contexts symbolize waiting or remembrance, "
-                    "e.g. 'Tie a Yellow Ribbon.'"
-                )
-            }
-        ]
-    },
-    {
-        "color": "Green",
-        "western_america": ["Nature", "Luck", "Greed"],
-        "europe": ["Nature", "Growth", "Youth", "Healing"],
-        "asia": ["Nature", "Youth", "Infidelity"],
-        "middle_east": ["Strength", "Luck", "Fertility"],
-        "latin_america": ["Nature", "Death", "Danger"],
-        "africa": ["Nature", "Fertility", "Growth"],
-        "oceania": ["Nature", "Healing", "Life"],
-        "academic_insights": [
-            {
-                "source": "Eric Chaline (2012), History of Green in Asia",
-                "note": (
-                    "In Chinese symbolism, green can represent health and prosperity, "
-                    "but wearing a 'green hat' can imply infidelity."
-                )
-            },
-            {
-                "source": "Adams & Rashid (2001), Green in the Middle East",
-                "note": (
-                    "Examines how green is regarded as the 'holy color' of Islam "
-                    "and is frequently used in flags and religious contexts."
-                )
-            }
-        ]
-    },
-    {
-        "color": "Orange",
-        "western_america": ["Energy", "Warmth", "Caution"],
-        "europe": ["Warmth", "Enthusiasm", "Caution"],
-        "asia": ["Courage", "Love", "Happiness"],
-        "middle_east": ["Wealth", "Strength", "Endurance"],
-        "latin_america": ["Sunshine", "Energy", "Celebration"],
-        "africa": ["Sacred", "Power", "Strength"],
-        "oceania": ["Courage", "Happiness", "Spirit"],
-        "academic_insights": [
-            {
-                "source": "Gage (1999), Color and Meaning: Art, Science, and Symbolism",
-                "note": (
-                    "Orange as a named color entered Western languages relatively late (related to the fruit); "
-                    "previously described as 'yellow-red.'"
-                )
-            },
-            {
-                "source": "Flood (2002), Hindu Symbolic Colors",
-                "note": (
-                    "In India, saffron/orange is a sacred color of Hinduism—monastic robes, signifying renunciation."
-                )
-            }
-        ]
-    },
-    {
-        "color": "Brown",
-        "western_america": ["Stability", "Reliability", "Earth"],
-        "europe": ["Earth", "Humility", "Stability"],
-        "asia": ["Humility", "Earth", "Endurance"],
-        "middle_east": ["Earth", "Humility", "Simplicity"],
-        "latin_america": ["Earth", "Poverty", "Warmth"],
-        "africa": ["Earth", "Strength", "Stability"],
-        "oceania": ["Earth", "Stability", "Tradition"],
-        "academic_insights": [
-            {
-                "source": "Berlin & Kay (1969), Basic Color Terms",
-                "note": (
-                    "Brown is typically recognized as a separate basic color term in later stages of language evolution, "
-                    "after categories like red, green, and blue are established."
-                )
-            },
-            {
-                "source": "Levi-Strauss (1978), Structural Anthropology on Earth Tones",
-                "note": (
-                    "Suggests that 'earthy' colors (brown/ochre) often symbolize agrarian roots, humility, or the natural world "
-                    "in many indigenous contexts."
-                )
-            }
-        ]
-    },
-    {
-        "color": "Pink",
-        "western_america": ["Femininity", "Love", "Romance"],
-        "europe": ["Love", "Tenderness", "Innocence"],
-        "asia": ["Happiness", "Feminine", "Strength"],
-        "middle_east": ["Femininity", "Beauty", "Innocence"],
-        "latin_america": ["Femininity", "Celebration", "Joy"],
-        "africa": ["Femininity", "Health", "Joy"],
-        "oceania": ["Femininity", "Joy", "Love"],
-        "academic_insights": [
-            {
-                "source": "Paoletti (2012), Pink and Blue",
-                "note": (
-                    "Explores how pink vs. blue for girls vs. boys in the West is a 20th-century phenomenon, "
-                    "not a universal historical norm."
-                )
-            },
-            {
-                "source": "Ling & Hurlbert (2011), Biological components of color preferences",
-                "note": (
-                    "Some studies find a mild female preference for reddish/pinkish hues, "
-                    "but the effect is not consistent across all cultures."
-                )
-            }
-        ]
-    },
-    {
-        "color": "Purple",
-        "western_america": ["Wealth", "Royalty", "Fame"],
-        "europe": ["Royalty", "Luxury", "Nobility", "Wisdom"],
-        "asia": ["Wealth", "Nobility", "Mourning"],
-        "middle_east": ["Wealth", "Virtue", "Omen"],
-        "latin_america": ["Death", "Sorrow", "Mourning"],
-        "africa": ["Power", "Royalty", "Spirituality"],
-        "oceania": ["Royalty", "Creativity", "Magic"],
-        "academic_insights": [
-            {
-                "source": "Michel Pastoureau (2016), Purple: A History",
-                "note": (
-                    "Tyrian purple was once extremely expensive, reserved for emperors and elites in Rome, Persia, Byzantium."
-                )
-            },
-            {
-                "source": "Davidoff (2001), Language and Perceptual Categorization",
-                "note": (
-                    "Illustrates how some societies categorize purple within blue or red, lacking a dedicated lexical label."
-                )
-            }
-        ]
-    }
-]
+"""
+Color symbolism across world regions, with supporting academic notes.
+
+The data lives in ``color_across_cultures.json`` next to this module and is parsed on
+first access of ``colors_across_cultures`` or ``COLORS_BY_NAME`` (PEP 562), so importing the
+module costs nothing until the table is actually used. The decoded JSON is
+cached in ``__pycache__`` (see ``_data_cache``) so later runs skip parsing.
+
+The loaded table is a tuple of immutable ``ColorEntry`` records (fixed slots,
+tuples throughout) and ``COLORS_BY_NAME`` gives O(1) lookup by name. Strings
+are interned so terms repeated across regions ("Purity", "Mourning", ...)
+share one object, and each academic insight is an
+``AcademicInsight(source, note)``. Both keep the old dict-style reads
+(``entry["asia"]``, ``entry.get(...)``, ``insight["note"]``).
+"""
+
+import os
+import sys
+from collections import namedtuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Tuple
+
+from ._data_cache import load_json
+
+class AcademicInsight(namedtuple("AcademicInsight", "source note")):
+    """One academic source; insight["source"] still works as with the old dicts."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+REGIONS = (
+    "western_america",
+    "europe",
+    "asia",
+    "middle_east",
+    "latin_america",
+    "africa",
+    "oceania",
+)
+
+
+@dataclass(frozen=True)
+class ColorEntry:
+    """Associations of one color in each region, plus academic sources."""
+
+    __slots__ = ("color",) + REGIONS + ("academic_insights",)
+
+    color: str
+    western_america: Tuple[str, ...]
+    europe: Tuple[str, ...]
+    asia: Tuple[str, ...]
+    middle_east: Tuple[str, ...]
+    latin_america: Tuple[str, ...]
+    africa: Tuple[str, ...]
+    oceania: Tuple[str, ...]
+    academic_insights: Tuple[AcademicInsight, ...]
+
+    # Mapping-style access, so code written against the old dict entries
+    # (entry["asia"], entry.get("europe", [])) keeps working
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+
+_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "color_across_cultures.json")
+
+
+def _make_entry(raw):
+    intern = sys.intern
+    return ColorEntry(
+        color=intern(raw["color"]),
+        **{region: tuple(intern(term) for term in raw.get(region, ())) for region in REGIONS},
+        academic_insights=tuple(
+            AcademicInsight(intern(item["source"]), intern(item["note"]))
+            for item in raw.get("academic_insights", ())
+        ),
+    )
+
+
+def _load():
+    colors_across_cultures = tuple(_make_entry(raw) for raw in load_json(_DATA_FILE))
+    globals().update(
+        colors_across_cultures=colors_across_cultures,
+        COLORS_BY_NAME=MappingProxyType({entry.color: entry for entry in colors_across_cultures}),
+    )
+
+
+def __getattr__(name):
+    if name in ("colors_across_cultures", "COLORS_BY_NAME"):
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,136 +1,45 @@
-color_combinations = [
-    {
-        "combo_name": "Red & White",
-        "usage_examples": [
-            {
-                "region_or_culture": "Japan",
-                "significance": (
-                    "National flag (rising sun). In celebrations (kohaku), symbolizes joy + purity."
-                )
-            },
-            {
-                "region_or_culture": "Poland, Indonesia, Monaco",
-                "significance": (
-                    "All have flags in red-and-white combos, each with distinct historical meaning."
-                )
-            },
-            {
-                "region_or_culture": "Denmark",
-                "significance": (
-                    "Dannebrog (white cross on red) is one of the oldest national flags in the world."
-                )
-            }
-        ]
-    },
-    {
-        "combo_name": "Green & Red",
-        "usage_examples": [
-            {
-                "region_or_culture": "Western (Christmas)",
-                "significance": (
-                    "Festive pairing in many Western nations—holly leaves (green) & berries (red)."
-                )
-            },
-            {
-                "region_or_culture": "Morocco",
-                "significance": (
-                    "Flag with a red field and a green pentagram (Seal of Solomon), representing faith."
-                )
-            },
-            {
-                "region_or_culture": "Portugal",
-                "significance": (
-                    "Green for hope and red for the blood of revolution, per the national flag's symbolism."
-                )
-            }
-        ]
-    },
-    {
-        "combo_name": "Green & White (Crescent)",
-        "usage_examples": [
-            {
-                "region_or_culture": "Islamic Contexts",
-                "significance": (
-                    "Often found in flags of Islamic nations (e.g. Pakistan, Algeria) symbolizing faith."
-                )
-            }
-        ]
-    },
-    {
-        "combo_name": "Blue & White",
-        "usage_examples": [
-            {
-                "region_or_culture": "Greece",
-                "significance": (
-                    "Flag evokes sea (blue) and purity/simplicity (white)."
-                )
-            },
-            {
-                "region_or_culture": "Israel",
-                "significance": (
-                    "Blue stripes + Star of David, referencing the tallit (Jewish prayer shawl)."
-                )
-            },
-            {
-                "region_or_culture": "Finland",
-                "significance": (
-                    "Blue cross on white: lakes (blue) & snow (white)."
-                )
-            }
-        ]
-    },
-    {
-        "combo_name": "Red, Gold/Yellow, & Green",
-        "usage_examples": [
-            {
-                "region_or_culture": "Pan-African",
-                "significance": (
-                    "Inspired by Ethiopia’s flag (green, yellow, red). Many African nations adopted these "
-                    "post-colonial era to represent unity, independence, and African identity."
-                )
-            },
-            {
-                "region_or_culture": "Rastafarian Symbolism",
-                "significance": (
-                    "Jamaican movement draws from the Ethiopian colors to represent African heritage, "
-                    "faith, and liberation."
-                )
-            }
-        ]
-    },
-    {
-        "combo_name": "Red, White, & Black",
-        "usage_examples": [
-            {
-                "region_or_culture": "Pan-Arab",
-                "significance": (
-                    "Along with green, forms the Pan-Arab colors (Jordan, UAE, Kuwait, Palestine, etc.), "
-                    "symbolizing Arab unity and the heritage of the Arab Revolt."
-                )
-            },
-            {
-                "region_or_culture": "Egypt, Iraq, Yemen",
-                "significance": (
-                    "Flags incorporate red, white, black to represent independence, unity, or revolution."
-                )
-            }
-        ]
-    },
-    {
-        "combo_name": "Orange & Saffron (Golden-Yellow)",
-        "usage_examples": [
-            {
-                "region_or_culture": "India",
-                "significance": (
-                    "Saffron, white, and green in the national flag. Saffron = courage, sacrifice."
-                )
-            },
-            {
-                "region_or_culture": "Bhutan",
-                "significance": (
-                    "Flag’s orange half = Drukpa Buddhist tradition; yellow half = secular monarchy."
-                )
-            }
-        ]
-    }
-]
+"""
+Culturally significant color combinations and where they are used.
+
+The data lives in ``color_combinations_cultural.json`` next to this module and is parsed on
+first access of ``color_combinations`` or ``COMBOS_BY_NAME`` (PEP 562), so importing the
+module costs nothing until the table is actually used. The decoded JSON is
+cached in ``__pycache__`` (see ``_data_cache``) so later runs skip parsing.
+
+The loaded table is frozen: entries are read-only mappings, nested lists
+become tuples, and ``COMBOS_BY_NAME`` gives O(1) lookup by name. Strings are
+interned so repeated names share one object.
+"""
+
+import os
+import sys
+from types import MappingProxyType
+
+from ._data_cache import load_json
+
+_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "color_combinations_cultural.json")
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _load():
+    color_combinations = _freeze(load_json(_DATA_FILE))
+    globals().update(
+        color_combinations=color_combinations,
+        COMBOS_BY_NAME=MappingProxyType({entry["combo_name"]: entry for entry in color_combinations}),
+    )
+
+
+def __getattr__(name):
+    if name in ("color_combinations", "COMBOS_BY_NAME"):
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
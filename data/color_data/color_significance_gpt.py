@@ -1,83 +1,123 @@
-color_significance = {
-    "Red": {
-        "Western": "Passion, love, urgency/danger, Christmas (with green)",
-        "Chinese": "Good luck, joy, celebrations (especially weddings, New Year)",
-        "Japanese": "Life, vitality (e.g. the red sun flag), sometimes associated with heroes",
-        "India/Hindu": "Purity, fertility, often worn by brides (red saris)",
-        "Middle East/Arab": "Can symbolize strength or danger; also Pan-Arab colors",
-        "Africa": "Varies by region; can represent blood of ancestors/liberation (e.g. many flags)",
-        "Latin America": "Passion, religious fervor (Catholic iconography), or can mean danger"
-    },
-    "White": {
-        "Western": "Purity, weddings, cleanliness, peace (white dove, white flag)",
-        "Chinese": "Mourning, funerals, death",
-        "Japanese": "Purity, sacredness (Shinto), but also used at funerals",
-        "India/Hindu": "Purity, mourning (especially in Hindu traditions)",
-        "Middle East/Arab": "Purity, often worn in religious contexts",
-        "Africa": "Purity, spiritual goodness in some regions; in others, used by healers",
-        "Latin America": "Peace (white dove), unity (some national flags)"
-    },
-    "Black": {
-        "Western": "Death, mourning, formality/elegance (black tie), evil in some contexts",
-        "Chinese": "Water element, darkness, (sometimes mourning in older traditions)",
-        "Japanese": "Formality (men’s wedding kimonos), but can also mean mourning",
-        "India/Hindu": "Evil or bad luck in some contexts (e.g., black tikka is used to ward off evil eye)",
-        "Middle East/Arab": "Evil or mystery, also used by some religious clerics for robes",
-        "Africa": "Age, maturity, ancestral spirits (varies widely by region)",
-        "Latin America": "Mourning (like Western), can be seen as elegant or formal"
-    },
-    "Green": {
-        "Western": "Nature, growth, luck (4-leaf clover), ‘go’ signals",
-        "Chinese": "Fertility, spring, youth (but a ‘green hat’ can mean a cuckolded husband)",
-        "Japanese": "Nature, youth, energy, respect for environment",
-        "India/Hindu": "Harvest, festivity, associated with Islam in some parts of India",
-        "Middle East/Arab": "Sacred in Islam, paradise, the Prophet’s color",
-        "Africa": "Agriculture, vegetation, fertility (many flags incorporate green)",
-        "Latin America": "Nature, hope, independence movements (Mexican flag’s green for independence)"
-    },
-    "Yellow/Gold": {
-        "Western": "Happiness, sunshine, caution (yellow light), gold = luxury/wealth",
-        "Chinese": "Royalty, power (imperial color), good fortune",
-        "Japanese": "Bravery, wealth, refinement (historically with gold brocade)",
-        "India/Hindu": "Saffron/yellow often sacred (Hindu monks’ robes, color of fire/godliness)",
-        "Middle East/Arab": "In some contexts, gold = wealth, status; yellow can be caution or envy",
-        "Africa": "Often associated with the sun, wealth, energy (e.g. many flags use gold/yellow)",
-        "Latin America": "Sun, wealth (gold), part of many flags from Spanish colonial symbolism"
-    },
-    "Blue": {
-        "Western": "Calm, trust, stability, sadness (“feeling blue”)",
-        "Chinese": "Immortality (traditional), trustworthiness, but not as symbolic as red or yellow",
-        "Japanese": "Everyday life (blue used to be common in working clothes), cleanliness",
-        "India/Hindu": "Krishna is depicted in blue, cosmic energy; can mean vitality, life",
-        "Middle East/Arab": "Protection from the evil eye (e.g. Nazar amulets), heaven/sky",
-        "Africa": "Varies widely; can symbolize love, peace, togetherness in some cultures",
-        "Latin America": "Can represent water, sky, independence (blue stripes in some national flags)"
-    },
-    "Purple/Violet": {
-        "Western": "Royalty, luxury, sometimes mourning (Victorian half-mourning)",
-        "Chinese": "Spiritual awareness, immortality in some Taoist beliefs",
-        "Japanese": "Wealth, nobility (historically worn by high-ranking officials)",
-        "India/Hindu": "Less codified meaning; can be associated with yoga/Chakra (crown chakra = violet)",
-        "Middle East/Arab": "Prestige, wealth, sometimes used in regal attire",
-        "Africa": "In some regions, associated with femininity or “mother earth” themes",
-        "Latin America": "Religious symbolism (Catholic liturgical color for Lent), penance"
-    },
-    "Pink": {
-        "Western": "Femininity, sweetness, romance, childlike innocence",
-        "Chinese": "Modern adoption: romance or admiration, not deeply traditional",
-        "Japanese": "Springtime (cherry blossoms), delicate, ephemeral beauty",
-        "India/Hindu": "Hospitality (Jaipur is called the ‘Pink City’), friendly welcomes",
-        "Middle East/Arab": "Generally not a strong symbolic color, but can mean romance or sweetness",
-        "Africa": "Varies; not a prominent symbolic color in many traditional African cultures",
-        "Latin America": "Love, sweetness, sometimes associated with celebrations (e.g. quinceañeras)"
-    },
-    "Brown": {
-        "Western": "Earth, stability, sometimes dullness or reliability",
-        "Chinese": "Often not a strong symbolic color; can mean humility or groundedness",
-        "Japanese": "Associated with the earth, nature, wabi‐sabi aesthetics of simplicity",
-        "India/Hindu": "Linked to the earth or asceticism (the color of plain cloth for some sadhus)",
-        "Middle East/Arab": "Desert landscapes, bedouin traditions (brown robes/tents)",
-        "Africa": "Soil, the land; in some tribes, clay or ochre is used for adornment",
-        "Latin America": "Earth, indigenous heritage, farmland in rural areas"
+"""
+What each basic color signifies across cultures, keyed by color then culture.
+
+The data lives in ``color_significance.json`` next to this module and is
+parsed on first access of any of the tables below or first call of a lookup
+function (PEP 562), so importing the module costs nothing until the data is
+actually used. The decoded JSON is cached in ``__pycache__`` (see
+``_data_cache``) so later runs skip parsing.
+
+``color_significance`` is read-only (``MappingProxyType`` at both levels) so
+the one table is shared safely by every caller. ``lookup(color, culture)``
+matches names case-insensitively through a table of pre-lowered, interned
+keys, and a combined name such as "Yellow/Gold" or "India/Hindu" also
+answers to each of its parts.
+
+``by_culture`` holds the same data column-wise (culture -> color ->
+meaning), so ``get_meanings`` can answer a whole batch of colors for one
+culture from a single small dict, and ``by_pair`` flattens it to
+``(color, culture) -> meaning`` for single lookups.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+from ._data_cache import load_json
+
+_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "color_significance.json")
+
+_LAZY_NAMES = frozenset({
+    "color_significance", "CULTURES", "COLOR_KEYS", "by_culture", "by_pair",
+})
+_LOADED = False
+
+
+def _keys(name):
+    """Lookup keys for an authored name: the lowered name, plus each part of an "A/B" name"""
+    key = name.lower()
+    yield key
+    if "/" in key:
+        yield from key.split("/")
+
+
+def _load():
+    global _LOADED, _BY_KEY_PAIR
+    intern = sys.intern
+
+    # Names and meanings are interned once here and every derived table
+    # reuses these objects: the (color, culture) tuple keys hash and compare
+    # cheaply, and a meaning repeated anywhere in the process is stored once
+    color_significance = MappingProxyType({
+        intern(color): MappingProxyType({
+            intern(culture): intern(meaning) for culture, meaning in cultures.items()
+        })
+        for color, cultures in load_json(_DATA_FILE).items()
+    })
+    # Every color carries the same set of cultures
+    cultures = tuple(next(iter(color_significance.values())))
+
+    by_culture = MappingProxyType({
+        culture: MappingProxyType({color: row[culture] for color, row in color_significance.items()})
+        for culture in cultures
+    })
+    # Flat (color, culture) -> meaning: one hash probe instead of two chained lookups
+    by_pair = MappingProxyType({
+        (color, culture): meaning
+        for color, row in color_significance.items()
+        for culture, meaning in row.items()
+    })
+    _BY_KEY_PAIR = {
+        (intern(color_key), intern(culture_key)): meaning
+        for (color, culture), meaning in by_pair.items()
+        for color_key in _keys(color)
+        for culture_key in _keys(culture)
     }
-}
+
+    globals().update(
+        color_significance=color_significance,
+        CULTURES=frozenset(cultures),
+        COLOR_KEYS=frozenset(key for key, _ in _BY_KEY_PAIR),
+        by_culture=by_culture,
+        by_pair=by_pair,
+    )
+    _LOADED = True
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def lookup(color, culture):
+    """Return what ``color`` signifies in ``culture``, ignoring case, or None if unknown"""
+    if not _LOADED:
+        _load()
+    return _BY_KEY_PAIR.get((color.lower(), culture.lower()))
+
+
+def get_meaning(color, culture):
+    """Return what ``color`` signifies in ``culture`` (exact authored names), or None"""
+    if not _LOADED:
+        _load()
+    return by_pair.get((color, culture))
+
+
+def get_meanings(colors, culture):
+    """Return the meaning in ``culture`` of each name in ``colors`` (None where unknown)
+
+    Raises KeyError for an unknown culture.
+    """
+    if not _LOADED:
+        _load()
+    column = by_culture[culture]
+    return [column.get(color) for color in colors]
+
+
+# Memoized lookup() for callers that ask about the same few pairs repeatedly;
+# describe.cache_info() reports hits and misses
+describe = lru_cache(maxsize=256)(lookup)
+
@@ -1,5 +1,18 @@
 # eric_metadata/__init__.py
-from .service import MetadataService
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .service import MetadataService
+
+
+def __getattr__(name):
+    # Resolve MetadataService lazily so importing a light submodule
+    # (e.g. hooks.runtime_capture or utils.config) does not load every handler.
+    if name == "MetadataService":
+        from .service import MetadataService
+        globals()[name] = MetadataService
+        return MetadataService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Version info
 __version__ = "0.1.0"
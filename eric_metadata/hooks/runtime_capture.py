@@ -7,8 +7,11 @@ import datetime
 import os
 import threading
 import time
+import weakref
+from collections import OrderedDict, deque, namedtuple
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type
 
 HookCallable = Callable[..., Any]
 
@@ -25,8 +28,19 @@ class HookSession:
     errors: List[str] = field(default_factory=list)
     # Performance tracking
     hook_call_count: int = 0
-    hook_total_time: float = 0.0
-    hook_max_time: float = 0.0
+    hook_total_time: int = 0  # ns
+    hook_max_time: int = 0  # ns
+    # Guards events/resolved_inputs/timing; hooks never take the global _LOCK
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+
+# Read-only snapshot returned by get_session: events/errors as tuples and
+# resolved_inputs as a mapping proxy over a shallow copy
+SessionView = namedtuple(
+    "SessionView",
+    "prompt_id prompt_payload start_ts events resolved_inputs errors "
+    "hook_call_count hook_total_time hook_max_time",
+)
 
 
 @dataclass
@@ -38,32 +52,131 @@ class HookState:
     auto_disabled: bool = False
     disable_reason: Optional[str] = None
     executor_class: Optional[Type[Any]] = None
+    # runtime_hooks.snapshot_prompt: copy the prompt at pre_execute, or keep a reference
+    snapshot_prompt: bool = True
+    # Bumped by every successful enable_hooks(); a deferred auto-disable only
+    # applies to the generation whose hook failed
+    generation: int = 0
+
+
+class BoundedSessionStore:
+    """LRU map of prompt_id -> HookSession holding at most ``max_sessions`` entries.
 
+    Sessions whose prompt never reaches a save node (errors, disconnects) are
+    evicted oldest-first instead of accumulating, and a warning is logged at
+    most once per ``WARN_INTERVAL`` seconds so the leak is still visible.
+    Writes happen under ``_LOCK``; ``get`` is called lock-free from the hooks.
+    """
+
+    WARN_INTERVAL = 60.0
+
+    def __init__(self, max_sessions: int = 256) -> None:
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, HookSession]" = OrderedDict()
+        self._evicted = 0
+        self._last_warning = float("-inf")
+
+    def get(self, prompt_id: str) -> Optional[HookSession]:
+        session = self._sessions.get(prompt_id)
+        if session is not None:
+            try:
+                self._sessions.move_to_end(prompt_id)
+            except KeyError:  # consumed concurrently
+                pass
+        return session
 
+    def __setitem__(self, prompt_id: str, session: HookSession) -> None:
+        self._sessions[prompt_id] = session
+        self._sessions.move_to_end(prompt_id)
+        while len(self._sessions) > self.max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            _forget_executor_prompts(evicted_id)
+            self._evicted += 1
+        if self._evicted:
+            now = time.monotonic()
+            if now - self._last_warning >= self.WARN_INTERVAL:
+                _log(
+                    f"Evicted {self._evicted} unconsumed session(s); more than "
+                    f"{self.max_sessions} prompts ran without reaching a save node"
+                )
+                self._evicted = 0
+                self._last_warning = now
+
+    def pop(self, prompt_id: str, default: Optional[HookSession] = None) -> Optional[HookSession]:
+        return self._sessions.pop(prompt_id, default)
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+    def keys(self) -> List[str]:
+        return list(self._sessions)
+
+    def __contains__(self, prompt_id: object) -> bool:
+        return prompt_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+# _LOCK serializes enable/disable and writes to the registries below. Hook
+# callbacks only read _SESSIONS/_EXECUTOR_PROMPTS (dict.get is atomic under
+# the GIL) and lock the individual session they touch. Executors and executor
+# classes are held weakly, so a discarded or reloaded one drops out by itself
+# and a new object reusing its id() can't inherit its entry.
 _LOCK = threading.RLock()
 _STATE = HookState()
-_SESSIONS: Dict[str, HookSession] = {}
-_EXECUTOR_PROMPTS: Dict[int, str] = {}
-_BASELINES: Dict[int, Dict[str, HookCallable]] = {}
+_SESSIONS = BoundedSessionStore()
+_EXECUTOR_PROMPTS: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+_BASELINES: "weakref.WeakKeyDictionary[Type[Any], Dict[str, HookCallable]]" = weakref.WeakKeyDictionary()
 _ORIGINALS: Dict[str, HookCallable] = {}
+# Every wrapper _wrap_callback has built, so conflict checks recognise our own
+_WRAPPERS: "weakref.WeakSet[HookCallable]" = weakref.WeakSet()
 _ERROR_SUPPRESSION: Dict[str, bool] = {}
 _ENV_FLAG = "AAA_METADATA_ENABLE_HOOKS"
 
+# Hooks push raw (session, type, time_ns, data) tuples onto a per-thread
+# buffer; they become event dicts with ISO timestamps only when flushed into
+# their sessions, every _EVENT_FLUSH_SIZE events or when a session is read.
+_EventRecord = Tuple[HookSession, str, int, Optional[Dict[str, Any]]]
+_EVENT_FLUSH_SIZE = 64
+_TLS = threading.local()
+_EVENT_BUFFERS: Dict[threading.Thread, Deque[_EventRecord]] = {}
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted by
+# _iso_timestamp; events arrive in bursts, so most share the cached prefix
+_ISO_CACHE: Tuple[int, str] = (-1, "")
+
+# (runtime_hooks.log_performance, debug.enabled), read once on first use
+_PERF_LOG_CACHE: Optional[Tuple[bool, bool]] = None
+
 
 def _log(message: str) -> None:
     print(f"[AAA Metadata Hooks] {message}")
 
 
+def invalidate_config_cache() -> None:
+    """Forget config values cached by the hooks; called by ``reload_config``."""
+    global _PERF_LOG_CACHE
+    _PERF_LOG_CACHE = None
+
+
+def _perf_log_flags() -> Tuple[bool, bool]:
+    global _PERF_LOG_CACHE
+    if _PERF_LOG_CACHE is None:
+        from ..utils.config import get_runtime_log_performance, get_debug_enabled
+        _PERF_LOG_CACHE = (bool(get_runtime_log_performance()), bool(get_debug_enabled()))
+    return _PERF_LOG_CACHE
+
+
 def _log_performance_metrics(session: HookSession) -> None:
     """Log performance metrics for a completed session."""
     try:
-        from ..utils.config import get_runtime_log_performance, get_debug_enabled
-        
-        if not (get_runtime_log_performance() and get_debug_enabled()):
+        log_performance, debug_enabled = _perf_log_flags()
+        if not (log_performance and debug_enabled):
             return
         
-        total_time_ms = session.hook_total_time * 1000
-        max_time_ms = session.hook_max_time * 1000
+        total_time_ms = session.hook_total_time / 1e6
+        max_time_ms = session.hook_max_time / 1e6
         avg_time_ms = (total_time_ms / session.hook_call_count) if session.hook_call_count > 0 else 0
         
         _log(
@@ -79,20 +192,10 @@ def _log_performance_metrics(session: HookSession) -> None:
 
 
 def _register_baseline(executor_class: Type[Any]) -> Dict[str, HookCallable]:
-    class_id = id(executor_class)
-    baseline = _BASELINES.get(class_id)
-    if baseline:
-        return baseline
-
-    pre_execute = getattr(executor_class, "pre_execute", None)
-    pre_get_input = getattr(executor_class, "pre_get_input_data", None)
-
-    baseline = {
-        "pre_execute": pre_execute,
-        "pre_get_input_data": pre_get_input,
-    }
-    _BASELINES[class_id] = baseline
-    return baseline
+    return _BASELINES.setdefault(executor_class, {
+        "pre_execute": getattr(executor_class, "pre_execute", None),
+        "pre_get_input_data": getattr(executor_class, "pre_get_input_data", None),
+    })
 
 
 def _is_conflicting(current: Optional[HookCallable], baseline: Optional[HookCallable]) -> bool:
@@ -100,7 +203,7 @@ def _is_conflicting(current: Optional[HookCallable], baseline: Optional[HookCall
         return False
     if current is baseline:
         return False
-    if getattr(current, "__aaa_metadata_wrapper__", False):
+    if current in _WRAPPERS:
         return False
     return True
 
@@ -115,24 +218,83 @@ def _extract_prompt_id(prompt_payload: Any) -> str:
 
 
 def _snapshot_prompt(payload: Any) -> Any:
+    if not _STATE.snapshot_prompt:
+        return payload
     try:
         return copy.deepcopy(payload)
     except Exception:
         return payload
 
 
+def _event_buffer() -> Deque[_EventRecord]:
+    buffer = getattr(_TLS, "events", None)
+    if buffer is None:
+        buffer = _TLS.events = deque()
+        with _LOCK:
+            _EVENT_BUFFERS[threading.current_thread()] = buffer
+    return buffer
+
+
+def _iso_timestamp(ts_ns: int) -> str:
+    """Format ``ts_ns`` like ``datetime.isoformat()`` for a UTC timestamp."""
+    global _ISO_CACHE
+    sec, nanos = divmod(ts_ns, 1_000_000_000)
+    cached_sec, prefix = _ISO_CACHE
+    if sec != cached_sec:
+        prefix = datetime.datetime.fromtimestamp(sec, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _ISO_CACHE = (sec, prefix)
+    micros = nanos // 1000
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+def _flush_events(buffer: Optional[Deque[_EventRecord]] = None) -> None:
+    """Move buffered events into their sessions (all threads' buffers by default)."""
+    if buffer is not None:
+        buffers = [buffer]
+    else:
+        with _LOCK:
+            buffers = list(_EVENT_BUFFERS.values())
+            # Forget buffers of threads that have exited once they are drained
+            for thread in [t for t, b in _EVENT_BUFFERS.items() if not t.is_alive() and not b]:
+                del _EVENT_BUFFERS[thread]
+
+    pending: Dict[int, Tuple[HookSession, List[Dict[str, Any]]]] = {}
+    for buf in buffers:
+        while True:
+            try:
+                session, event_type, ts_ns, data = buf.popleft()
+            except IndexError:
+                break
+            event = {
+                "type": event_type,
+                "timestamp": _iso_timestamp(ts_ns),
+            }
+            if data:
+                event.update(data)
+            pending.setdefault(id(session), (session, []))[1].append(event)
+
+    for session, events in pending.values():
+        with session._lock:
+            session.events.extend(events)
+
+
+def _discard_buffered_events() -> None:
+    with _LOCK:
+        for buffer in _EVENT_BUFFERS.values():
+            buffer.clear()
+
+
 def _record_event(session: HookSession, event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
-    event = {
-        "type": event_type,
-        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-    }
-    if data:
-        event.update(data)
-    session.events.append(event)
+    buffer = _event_buffer()
+    buffer.append((session, event_type, time.time_ns(), data))
+    if len(buffer) >= _EVENT_FLUSH_SIZE:
+        _flush_events(buffer)
 
 
 def _capture_pre_execute(executor: Any, *args: Any, **kwargs: Any) -> None:
-    hook_start = time.perf_counter()
+    hook_start = time.perf_counter_ns()
     
     prompt_payload = args[0] if args else kwargs.get("prompt")
     prompt_id = _extract_prompt_id(prompt_payload)
@@ -146,31 +308,28 @@ def _capture_pre_execute(executor: Any, *args: Any, **kwargs: Any) -> None:
 
     with _LOCK:
         _SESSIONS[prompt_id] = session
-        _EXECUTOR_PROMPTS[id(executor)] = prompt_id
+        _EXECUTOR_PROMPTS[executor] = prompt_id
     
     # Track performance
-    hook_elapsed = time.perf_counter() - hook_start
+    hook_elapsed = time.perf_counter_ns() - hook_start
     session.hook_call_count += 1
     session.hook_total_time += hook_elapsed
-    session.hook_max_time = max(session.hook_max_time, hook_elapsed)
+    if hook_elapsed > session.hook_max_time:
+        session.hook_max_time = hook_elapsed
+
+
+_SCALARS = (str, int, float, bool)
+_SCALAR_TYPES = frozenset(_SCALARS)
 
 
 def _capture_pre_get_input_data(executor: Any, *args: Any, **kwargs: Any) -> None:
-    hook_start = time.perf_counter()
+    hook_start = time.perf_counter_ns()
     
-    with _LOCK:
-        prompt_id = _EXECUTOR_PROMPTS.get(id(executor))
-        session = _SESSIONS.get(prompt_id) if prompt_id else None
+    prompt_id = _EXECUTOR_PROMPTS.get(executor)
+    session = _SESSIONS.get(prompt_id) if prompt_id else None
 
     if not session:
         return
-    
-    # Track performance at end of function
-    def _track_performance():
-        hook_elapsed = time.perf_counter() - hook_start
-        session.hook_call_count += 1
-        session.hook_total_time += hook_elapsed
-        session.hook_max_time = max(session.hook_max_time, hook_elapsed)
 
     node_id: Optional[str] = None
     if args:
@@ -197,10 +356,12 @@ def _capture_pre_get_input_data(executor: Any, *args: Any, **kwargs: Any) -> Non
 
     safe_payload = None
     if isinstance(payload_extract, dict):
-        safe_payload = {}
-        for key, value in payload_extract.items():
-            if isinstance(value, (str, int, float, bool)):
-                safe_payload[key] = value
+        # Exact-type set probe first; isinstance still admits subclasses (e.g. numpy.float64)
+        safe_payload = {
+            key: value
+            for key, value in payload_extract.items()
+            if type(value) in _SCALAR_TYPES or isinstance(value, _SCALARS)
+        }
 
     _record_event(
         session,
@@ -211,16 +372,23 @@ def _capture_pre_get_input_data(executor: Any, *args: Any, **kwargs: Any) -> Non
         },
     )
 
-    if safe_payload:
-        with _LOCK:
+    hook_elapsed = time.perf_counter_ns() - hook_start
+    with session._lock:
+        if safe_payload:
             session.resolved_inputs.setdefault(node_id or "unknown", {}).update(safe_payload)
-    
-    # Track performance
-    _track_performance()
+        # Track performance
+        session.hook_call_count += 1
+        session.hook_total_time += hook_elapsed
+        if hook_elapsed > session.hook_max_time:
+            session.hook_max_time = hook_elapsed
 
 
 def _wrap_callback(name: str, original: HookCallable, capture_fn: Callable[..., None]) -> HookCallable:
     def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        # Lock-free check: calls that land between auto-disable and the
+        # unwrap in disable_hooks skip capture
+        if _STATE.auto_disabled or not _STATE.enabled:
+            return original(self, *args, **kwargs)
         try:
             capture_fn(self, *args, **kwargs)
         except Exception as exc:  # pragma: no cover - safety path
@@ -228,16 +396,30 @@ def _wrap_callback(name: str, original: HookCallable, capture_fn: Callable[...,
             if not _ERROR_SUPPRESSION.get(key):
                 _ERROR_SUPPRESSION[key] = True
                 _log(f"Error inside {name} hook: {exc}. Auto-disabling hooks.")
-            with _LOCK:
-                _STATE.auto_disabled = True
-            disable_hooks(auto=True)
+            # Later calls see the flag and skip capture at once; unwrapping
+            # takes _LOCK, so it runs off the execution thread
+            _STATE.auto_disabled = True
+            threading.Thread(
+                target=_auto_disable,
+                args=(_STATE.generation,),
+                name="aaa-metadata-hooks-disable",
+                daemon=True,
+            ).start()
         return original(self, *args, **kwargs)
 
     wrapper.__aaa_metadata_wrapper__ = True
     wrapper.__aaa_metadata_original__ = original
+    _WRAPPERS.add(wrapper)
     return wrapper
 
 
+def _auto_disable(generation: int) -> None:
+    """Disable hooks after a capture error, unless they were re-enabled since."""
+    with _LOCK:
+        if _STATE.generation == generation:
+            disable_hooks(auto=True)
+
+
 def enable_hooks(*, executor_class: Optional[Type[Any]] = None) -> bool:
     with _LOCK:
         if _STATE.enabled:
@@ -274,7 +456,15 @@ def enable_hooks(*, executor_class: Optional[Type[Any]] = None) -> bool:
             setattr(target_cls, "pre_get_input_data", wrapped_pre_get)
             _ORIGINALS["pre_get_input_data"] = baseline["pre_get_input_data"]
 
+        try:
+            from ..utils.config import get_runtime_max_sessions, get_runtime_snapshot_prompt
+            _STATE.snapshot_prompt = get_runtime_snapshot_prompt()
+            _SESSIONS.max_sessions = get_runtime_max_sessions()
+        except Exception:
+            _STATE.snapshot_prompt = True
+
         _STATE.enabled = True
+        _STATE.generation += 1
         _STATE.executor_class = target_cls
         _STATE.auto_disabled = False
         _STATE.disable_reason = None
@@ -292,6 +482,7 @@ def disable_hooks(*, auto: bool = False) -> bool:
                 _STATE.auto_disabled = True
             _SESSIONS.clear()
             _EXECUTOR_PROMPTS.clear()
+            _discard_buffered_events()
             return False
 
         baseline = _register_baseline(target_cls)
@@ -309,6 +500,7 @@ def disable_hooks(*, auto: bool = False) -> bool:
         _ERROR_SUPPRESSION.clear()
         _SESSIONS.clear()
         _EXECUTOR_PROMPTS.clear()
+        _discard_buffered_events()
         _log("Runtime hooks disabled")
         return True
 
@@ -318,19 +510,37 @@ def hooks_enabled() -> bool:
         return _STATE.enabled and not _STATE.auto_disabled
 
 
-def get_session(prompt_id: str) -> Optional[HookSession]:
-    with _LOCK:
-        session = _SESSIONS.get(prompt_id)
-        return copy.deepcopy(session) if session else None
+def get_session(prompt_id: str) -> Optional[SessionView]:
+    session = _SESSIONS.get(prompt_id)
+    if not session:
+        return None
+    _flush_events()
+    with session._lock:
+        return SessionView(
+            prompt_id=session.prompt_id,
+            prompt_payload=session.prompt_payload,
+            start_ts=session.start_ts,
+            events=tuple(session.events),
+            resolved_inputs=MappingProxyType(dict(session.resolved_inputs)),
+            errors=tuple(session.errors),
+            hook_call_count=session.hook_call_count,
+            hook_total_time=session.hook_total_time,
+            hook_max_time=session.hook_max_time,
+        )
+
+
+def _forget_executor_prompts(prompt_id: str) -> None:
+    keys_to_remove = [key for key, value in _EXECUTOR_PROMPTS.items() if value == prompt_id]
+    for key in keys_to_remove:
+        _EXECUTOR_PROMPTS.pop(key, None)
 
 
 def consume_session(prompt_id: str) -> Optional[HookSession]:
     with _LOCK:
         session = _SESSIONS.pop(prompt_id, None)
         if session:
-            keys_to_remove = [key for key, value in _EXECUTOR_PROMPTS.items() if value == prompt_id]
-            for key in keys_to_remove:
-                _EXECUTOR_PROMPTS.pop(key, None)
+            _flush_events()
+            _forget_executor_prompts(prompt_id)
             
             # Log performance metrics if enabled
             _log_performance_metrics(session)
@@ -340,7 +550,7 @@ def consume_session(prompt_id: str) -> Optional[HookSession]:
 
 def active_prompt_ids() -> List[str]:
     with _LOCK:
-        return list(_SESSIONS.keys())
+        return _SESSIONS.keys()
 
 
 def auto_enable_from_env(*, executor_class: Optional[Type[Any]] = None) -> None:
@@ -378,15 +588,20 @@ def reset_state_for_tests() -> None:
         _SESSIONS.clear()
         _EXECUTOR_PROMPTS.clear()
         _ERROR_SUPPRESSION.clear()
+        _discard_buffered_events()
         _STATE.enabled = False
         _STATE.conflict_detected = False
         _STATE.auto_disabled = False
         _STATE.disable_reason = None
         _STATE.executor_class = None
+        # Invalidate any auto-disable still queued from before the reset
+        _STATE.generation += 1
 
 
 __all__ = [
     "HookSession",
+    "BoundedSessionStore",
+    "SessionView",
     "enable_hooks",
     "disable_hooks",
     "hooks_enabled",
@@ -395,4 +610,5 @@ __all__ = [
     "active_prompt_ids",
     "auto_enable_from_env",
     "reset_state_for_tests",
+    "invalidate_config_cache",
 ]
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
-import re
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 from .version import get_metadata_system_version_label
 
 METADATA_SYSTEM_GENERATED_BY = get_metadata_system_version_label()
 
-_EMPTY_SEQUENCE = (None, "", [])
+
+
+# Every top-level key generate_a1111_parameters reads; metadata with none of
+# them can only produce an empty string
+_SOURCE_KEYS = frozenset({
+    "ai_info", "generation", "prompts", "prompt", "positive_prompt", "negative_prompt", "negative",
+    "sampling", "steps", "sampler", "sampler_name", "cfg_scale", "cfg", "seed",
+    "dimensions", "technical", "analysis", "image",
+    "base_model", "model", "model_hash", "modules", "assets", "loras",
+})
+
+
+def _is_empty(value: Any) -> bool:
+    """True for None, "" and [] (but not 0 or False, which are real values)."""
+    return value is None or value == "" or value == []
 
 
 def _ensure_dict(value: Any) -> Dict[str, Any]:
@@ -17,6 +30,9 @@ def _ensure_dict(value: Any) -> Dict[str, Any]:
 
 
 def _normalize_prompt(value: Any) -> str:
+    # Exact-type check first: almost every prompt is a plain str
+    if type(value) is str:
+        return value.strip()
     if value is None:
         return ""
     if isinstance(value, str):
@@ -46,16 +62,14 @@ def _first_text(candidates: Iterable[Any]) -> str:
     return ""
 
 
-def _pick_value(*candidates: Any) -> Any:
-    for candidate in candidates:
-        if isinstance(candidate, tuple) and len(candidate) == 2:
-            container, key = candidate
-            if isinstance(container, dict) and key in container:
-                value = container[key]
-                if value not in _EMPTY_SEQUENCE:
-                    return value
-        elif candidate not in _EMPTY_SEQUENCE:
-            return candidate
+def _first(containers: Sequence[Dict[str, Any]], *keys: str) -> Any:
+    """Return the first non-empty ``container[key]``, trying every key in each container in turn."""
+    for container in containers:
+        get = container.get
+        for key in keys:
+            value = get(key)
+            if value is not None and value != "" and value != []:
+                return value
     return None
 
 
@@ -76,11 +90,14 @@ def _to_int(value: Any) -> Optional[int]:
 
 
 def _clean_name(value: Any) -> str:
+    # split() with no argument drops leading/trailing whitespace and collapses runs
+    if type(value) is str:
+        return " ".join(value.split())
     if value is None:
         return ""
     if not isinstance(value, str):
         value = str(value)
-    return re.sub(r"\s+", " ", value).strip()
+    return " ".join(value.split())
 
 
 def _coerce_float(value: Any, default: float) -> float:
@@ -98,6 +115,11 @@ def _coerce_float(value: Any, default: float) -> float:
 
 
 def _format_strength(value: float) -> str:
+    # Whole strengths (1.0, 2.0) are the common case and need no stripping;
+    # zero keeps the format path so -0.0 still renders as "-0", and
+    # is_integer() is False for inf/nan, which fall through as well
+    if value and value.is_integer():
+        return str(int(value))
     formatted = f"{value:.2f}"
     if "." in formatted:
         formatted = formatted.rstrip("0").rstrip(".")
@@ -127,14 +149,6 @@ def _iter_lora_sources(*containers: Any) -> List[Any]:
     return sources
 
 
-def _pick_dimension(keys: Sequence[str], sources: Sequence[Dict[str, Any]]) -> Any:
-    for source in sources:
-        for key in keys:
-            if key in source and source[key] not in _EMPTY_SEQUENCE:
-                return source[key]
-    return None
-
-
 def generate_a1111_parameters(
     metadata: Optional[Dict[str, Any]],
     *,
@@ -142,103 +156,79 @@ def generate_a1111_parameters(
 ) -> str:
     if not metadata or not isinstance(metadata, dict):
         return ""
+    if _SOURCE_KEYS.isdisjoint(metadata):
+        return ""
 
     strength_formatter = format_strength or _format_strength
 
+    # Each section is resolved once and its bound .get reused for every probe below
     root_metadata = metadata
-    ai_info = _ensure_dict(root_metadata.get("ai_info"))
-    generation = _ensure_dict(ai_info.get("generation"))
+    root_get = root_metadata.get
+    ai_info = _ensure_dict(root_get("ai_info"))
+    ai_get = ai_info.get
+    generation = _ensure_dict(ai_get("generation"))
     if not generation:
-        generation = _ensure_dict(root_metadata.get("generation"))
+        generation = _ensure_dict(root_get("generation"))
+    gen_get = generation.get
 
-    prompts_section = _ensure_dict(generation.get("prompts"))
-    ai_prompts = _ensure_dict(ai_info.get("prompts"))
-    metadata_prompts = _ensure_dict(root_metadata.get("prompts"))
-    workflow_info = _ensure_dict(ai_info.get("workflow_info"))
+    prompts_section = _ensure_dict(gen_get("prompts"))
+    ai_prompts = _ensure_dict(ai_get("prompts"))
+    metadata_prompts = _ensure_dict(root_get("prompts"))
+    workflow_info = _ensure_dict(ai_get("workflow_info"))
     workflow_prompts = _ensure_dict(workflow_info.get("prompts"))
 
     positive_prompt = _first_text([
-        generation.get("positive_prompt"),
+        gen_get("positive_prompt"),
         prompts_section.get("positive"),
-        generation.get("prompt"),
+        gen_get("prompt"),
         ai_prompts.get("positive"),
         metadata_prompts.get("positive"),
         workflow_prompts.get("positive"),
-        root_metadata.get("positive_prompt"),
-        root_metadata.get("prompt"),
+        root_get("positive_prompt"),
+        root_get("prompt"),
     ])
 
     negative_prompt = _first_text([
-        generation.get("negative_prompt"),
+        gen_get("negative_prompt"),
         prompts_section.get("negative"),
-        generation.get("negative"),
-        generation.get("negative_prompts"),
+        gen_get("negative"),
+        gen_get("negative_prompts"),
         ai_prompts.get("negative"),
         metadata_prompts.get("negative"),
         workflow_prompts.get("negative"),
-        root_metadata.get("negative_prompt"),
-        root_metadata.get("negative"),
+        root_get("negative_prompt"),
+        root_get("negative"),
     ])
 
-    params: List[str] = []
-
-    sampling = _ensure_dict(generation.get("sampling"))
-    metadata_sampling = _ensure_dict(root_metadata.get("sampling"))
+    sampling = _ensure_dict(gen_get("sampling"))
+    metadata_sampling = _ensure_dict(root_get("sampling"))
     workflow_sampling = _ensure_dict(workflow_info.get("sampling"))
 
-    steps = _pick_value(
-        (sampling, "steps"),
-        (workflow_sampling, "steps"),
-        (metadata_sampling, "steps"),
-        (generation, "steps"),
-        (root_metadata, "steps"),
-    )
-    if steps not in _EMPTY_SEQUENCE:
-        params.append(f"Steps: {steps}")
-
-    sampler_value = _pick_value(
-        (sampling, "sampler"),
-        (sampling, "sampler_name"),
-        (workflow_sampling, "sampler"),
-        (metadata_sampling, "sampler"),
-        (generation, "sampler"),
-        (generation, "sampler_name"),
-        (root_metadata, "sampler"),
-    )
-    if sampler_value not in _EMPTY_SEQUENCE:
-        params.append(f"Sampler: {sampler_value}")
-
-    cfg_scale = _pick_value(
-        (sampling, "cfg_scale"),
-        (sampling, "cfg"),
-        (workflow_sampling, "cfg_scale"),
-        (metadata_sampling, "cfg_scale"),
-        (metadata_sampling, "cfg"),
-        (generation, "cfg_scale"),
-        (generation, "cfg"),
-        (root_metadata, "cfg_scale"),
-        (root_metadata, "cfg"),
-    )
-    if cfg_scale not in _EMPTY_SEQUENCE:
-        params.append(f"CFG scale: {cfg_scale}")
-
-    seed_value = _pick_value(
-        (sampling, "seed"),
-        (workflow_sampling, "seed"),
-        (metadata_sampling, "seed"),
-        (generation, "seed"),
-        (root_metadata, "seed"),
-    )
-    if seed_value not in _EMPTY_SEQUENCE:
-        params.append(f"Seed: {seed_value}")
-
-    dimensions = _ensure_dict(generation.get("dimensions"))
-    metadata_dimensions = _ensure_dict(root_metadata.get("dimensions"))
+    sampling_sources = (sampling, workflow_sampling, metadata_sampling, generation, root_metadata)
+
+    steps = _first(sampling_sources, "steps")
+    # Not every source accepts every alias for the sampler and CFG keys
+    sampler_value = _first((sampling,), "sampler", "sampler_name")
+    if sampler_value is None:
+        sampler_value = _first((workflow_sampling, metadata_sampling), "sampler")
+    if sampler_value is None:
+        sampler_value = _first((generation,), "sampler", "sampler_name")
+    if sampler_value is None:
+        sampler_value = _first((root_metadata,), "sampler")
+    cfg_scale = _first((sampling,), "cfg_scale", "cfg")
+    if cfg_scale is None:
+        cfg_scale = _first((workflow_sampling,), "cfg_scale")
+    if cfg_scale is None:
+        cfg_scale = _first((metadata_sampling, generation, root_metadata), "cfg_scale", "cfg")
+    seed_value = _first(sampling_sources, "seed")
+
+    dimensions = _ensure_dict(gen_get("dimensions"))
+    metadata_dimensions = _ensure_dict(root_get("dimensions"))
     workflow_dimensions = _ensure_dict(workflow_info.get("dimensions"))
-    technical = _ensure_dict(root_metadata.get("technical"))
-    analysis = _ensure_dict(_ensure_dict(root_metadata.get("analysis")).get("technical"))
-    image_info = _ensure_dict(root_metadata.get("image"))
-    ai_image = _ensure_dict(ai_info.get("image"))
+    technical = _ensure_dict(root_get("technical"))
+    analysis = _ensure_dict(_ensure_dict(root_get("analysis")).get("technical"))
+    image_info = _ensure_dict(root_get("image"))
+    ai_image = _ensure_dict(ai_get("image"))
 
     dimension_sources: List[Dict[str, Any]] = [
         dimensions,
@@ -251,79 +241,64 @@ def generate_a1111_parameters(
         generation,
     ]
 
-    width_value = _pick_dimension(("width", "W"), dimension_sources)
-    height_value = _pick_dimension(("height", "H"), dimension_sources)
+    width_value = _first(dimension_sources, "width", "W")
+    height_value = _first(dimension_sources, "height", "H")
 
-    if width_value in _EMPTY_SEQUENCE or height_value in _EMPTY_SEQUENCE:
+    if _is_empty(width_value) or _is_empty(height_value):
         for source in dimension_sources:
             size_value = source.get("size") if isinstance(source, dict) else None
             if isinstance(size_value, str) and "x" in size_value.lower():
                 parts = size_value.lower().replace(" ", "").split("x")
                 if len(parts) >= 2:
-                    width_value = width_value if width_value not in _EMPTY_SEQUENCE else parts[0]
-                    height_value = height_value if height_value not in _EMPTY_SEQUENCE else parts[1]
+                    width_value = parts[0] if _is_empty(width_value) else width_value
+                    height_value = parts[1] if _is_empty(height_value) else height_value
             elif isinstance(size_value, (list, tuple)) and len(size_value) >= 2:
-                width_value = width_value if width_value not in _EMPTY_SEQUENCE else size_value[0]
-                height_value = height_value if height_value not in _EMPTY_SEQUENCE else size_value[1]
+                width_value = size_value[0] if _is_empty(width_value) else width_value
+                height_value = size_value[1] if _is_empty(height_value) else height_value
 
     width_int = _to_int(width_value)
     height_int = _to_int(height_value)
-    if width_int and height_int:
-        params.append(f"Size: {width_int}x{height_int}")
+    size = f"{width_int}x{height_int}" if width_int and height_int else None
 
-    base_model = _ensure_dict(generation.get("base_model"))
+    base_model = _ensure_dict(gen_get("base_model"))
     if not base_model:
-        base_model = _ensure_dict(ai_info.get("base_model"))
+        base_model = _ensure_dict(ai_get("base_model"))
     if not base_model:
-        base_model = _ensure_dict(root_metadata.get("base_model"))
-
-    model_name = _pick_value(
-        (base_model, "name"),
-        (base_model, "model"),
-        (base_model, "unet"),
-        (base_model, "ckpt_name"),
-        (generation, "model"),
-        (root_metadata, "model"),
-    )
-    if model_name not in _EMPTY_SEQUENCE:
-        params.append(f"Model: {model_name}")
-
-    model_hash = _pick_value(
-        (base_model, "hash"),
-        (base_model, "model_hash"),
-        (base_model, "sha256"),
-        (base_model, "checksum"),
-        (base_model, "short_hash"),
-        (base_model, "model_hash_sha256"),
-        (generation, "model_hash"),
-        (generation, "hash"),
-        (generation, "checksum"),
-        (root_metadata, "model_hash"),
+        base_model = _ensure_dict(root_get("base_model"))
+
+    model_name = _first((base_model,), "name", "model", "unet", "ckpt_name")
+    if model_name is None:
+        model_name = _first((generation, root_metadata), "model")
+
+    model_hash = _first(
+        (base_model,), "hash", "model_hash", "sha256", "checksum", "short_hash", "model_hash_sha256"
     )
-    if model_hash not in _EMPTY_SEQUENCE:
-        params.append(f"Model hash: {model_hash}")
+    if model_hash is None:
+        model_hash = _first((generation,), "model_hash", "hash", "checksum")
+    if model_hash is None:
+        model_hash = _first((root_metadata,), "model_hash")
 
-    modules = _ensure_dict(generation.get("modules"))
-    metadata_modules = _ensure_dict(root_metadata.get("modules"))
-    ai_assets = _ensure_dict(ai_info.get("assets"))
-    metadata_assets = _ensure_dict(root_metadata.get("assets"))
-    generation_assets = _ensure_dict(generation.get("assets"))
+    modules = _ensure_dict(gen_get("modules"))
+    metadata_modules = _ensure_dict(root_get("modules"))
+    ai_assets = _ensure_dict(ai_get("assets"))
+    metadata_assets = _ensure_dict(root_get("assets"))
+    generation_assets = _ensure_dict(gen_get("assets"))
 
     lora_sources = _iter_lora_sources(
-        generation.get("loras"),
+        gen_get("loras"),
         modules,
         metadata_modules,
         generation_assets,
         metadata_assets,
         ai_assets,
-        root_metadata.get("loras"),
+        root_get("loras"),
     )
 
     lora_entries = _collect_lora_entries(lora_sources)
 
+    formatted_loras: List[str] = []
     if lora_entries:
         seen = set()
-        formatted_loras: List[str] = []
         for lora in lora_entries:
             name = _clean_name(
                 lora.get("name")
@@ -334,18 +309,11 @@ def generate_a1111_parameters(
             if not name:
                 continue
 
-            raw_model_strength = _pick_value(
-                (lora, "strength_model"),
-                (lora, "strength"),
-                (lora, "weight"),
-            )
-            raw_clip_strength = _pick_value(
-                (lora, "strength_clip"),
-                (lora, "clip_strength"),
-            )
+            raw_model_strength = _first((lora,), "strength_model", "strength", "weight")
+            raw_clip_strength = _first((lora,), "strength_clip", "clip_strength")
 
             strength_model_value = _coerce_float(raw_model_strength, 1.0)
-            if raw_model_strength in _EMPTY_SEQUENCE and raw_clip_strength not in _EMPTY_SEQUENCE:
+            if raw_model_strength is None and raw_clip_strength is not None:
                 strength_model_value = _coerce_float(raw_clip_strength, strength_model_value)
 
             strength_clip_value = _coerce_float(raw_clip_strength, strength_model_value)
@@ -358,16 +326,24 @@ def generate_a1111_parameters(
                 continue
             seen.add(key)
 
-            formatted_loras.append(f"{name} ({formatted_model}, {formatted_clip})")
-
-        if formatted_loras:
-            params.append(f"LoRA: {'; '.join(formatted_loras)}")
-
-    has_prompt = bool(positive_prompt or negative_prompt)
+            formatted_loras.append("%s (%s, %s)" % (name, formatted_model, formatted_clip))
+
+    # Fixed A1111 field order; None marks a field with no value
+    parts = {
+        "Steps": steps,
+        "Sampler": sampler_value,
+        "CFG scale": cfg_scale,
+        "Seed": seed_value,
+        "Size": size,
+        "Model": model_name,
+        "Model hash": model_hash,
+        "LoRA": "; ".join(formatted_loras) or None,
+    }
+    params = ", ".join(f"{label}: {value}" for label, value in parts.items() if value is not None)
     if params:
-        params.append(METADATA_SYSTEM_GENERATED_BY)
-    elif has_prompt:
-        params.append(METADATA_SYSTEM_GENERATED_BY)
+        params = f"{params}, {METADATA_SYSTEM_GENERATED_BY}"
+    elif positive_prompt or negative_prompt:
+        params = METADATA_SYSTEM_GENERATED_BY
 
     lines: List[str] = []
     if positive_prompt:
@@ -375,10 +351,10 @@ def generate_a1111_parameters(
     if negative_prompt:
         lines.append(f"Negative prompt: {negative_prompt}")
     if params:
-        lines.append(", ".join(params))
+        lines.append(params)
 
     if not lines:
-        has_ai_section = isinstance(metadata, dict) and metadata.get("ai_info") is not None
+        has_ai_section = root_get("ai_info") is not None
         return METADATA_SYSTEM_GENERATED_BY if has_ai_section else ""
 
     return "\n".join(lines).strip()
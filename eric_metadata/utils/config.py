@@ -2,12 +2,38 @@
 
 import json
 import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 _CONFIG_CACHE: Optional[Dict[str, Any]] = None
 _CONFIG_PATH: Optional[Path] = None
+# Serializes loading so concurrent first calls parse config.json only once;
+# reads of an already-loaded config never take it
+_CONFIG_LOCK = threading.Lock()
+# Dotted-path view of _CONFIG_CACHE ("runtime_hooks.enabled" -> False), built
+# alongside it so each getter is a single dict lookup
+_FLAT: Optional[Dict[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Resolved runtime settings (config.json plus environment overrides)."""
+
+    hooks_enabled: bool
+    debug: bool
+    hash_cache: bool
+    log_disagreements: bool
+    log_performance: bool
+    inline_limit_bytes: int
+    snapshot_prompt: bool
+    max_sessions: int
+
+
+# Built from the config and environment on first access; reset by reload_config
+_SETTINGS: Optional[Settings] = None
 
 
 def get_config_path() -> Path:
@@ -32,19 +58,42 @@ def load_config() -> Dict[str, Any]:
     Returns:
         dict: Configuration dictionary with defaults for missing values
     """
-    global _CONFIG_CACHE
+    # Return cached config if available (lock-free fast path)
+    config = _CONFIG_CACHE
+    if config is not None:
+        return config
     
-    # Return cached config if available
-    if _CONFIG_CACHE is not None:
-        return _CONFIG_CACHE
+    with _CONFIG_LOCK:
+        return _load_locked()[0]
+
+
+def _load_locked() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return the config and its flat view, loading both if needed.
     
+    Callers must hold _CONFIG_LOCK, so the pair always comes from one load.
+    """
+    global _CONFIG_CACHE, _FLAT
+    config, flat = _CONFIG_CACHE, _FLAT
+    # Another thread may have loaded it while we waited for the lock
+    if config is None or flat is None:
+        config = _read_config()
+        flat = _flatten_config(config)
+        _FLAT = flat
+        _CONFIG_CACHE = config
+    return config, flat
+
+
+def _read_config() -> Dict[str, Any]:
+    """Read config.json and merge it over the defaults."""
     # Default configuration
     default_config = {
         "runtime_hooks": {
             "enabled": False,
             "log_disagreements": False,
             "log_performance": False,
-            "inline_size_limit_kb": 32
+            "inline_size_limit_kb": 32,
+            "snapshot_prompt": True,
+            "max_sessions": 256
         },
         "debug": {
             "enabled": False
@@ -63,18 +112,93 @@ def load_config() -> Dict[str, Any]:
                 file_config = json.load(f)
             
             # Merge with defaults (file config takes precedence)
-            merged_config = _deep_merge(default_config, file_config)
-            _CONFIG_CACHE = merged_config
-            return merged_config
+            return _deep_merge(default_config, file_config)
         except Exception as e:
             print(f"[AAA Metadata Config] Warning: Failed to load config.json: {e}")
             print(f"[AAA Metadata Config] Using default configuration")
     
     # No config file or failed to load - use defaults
-    _CONFIG_CACHE = default_config
     return default_config
 
 
+def _flatten_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a merged config into dotted keys.
+    
+    Args:
+        config: Merged configuration dictionary
+        
+    Returns:
+        dict: Mapping of dotted paths (e.g. "debug.enabled") to leaf values
+    """
+    flat: Dict[str, Any] = {}
+    stack = [("", config)]
+    while stack:
+        prefix, section = stack.pop()
+        for key, value in section.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict):
+                stack.append((f"{path}.", value))
+            else:
+                flat[path] = value
+    return flat
+
+
+def _settings() -> Settings:
+    """Return the resolved settings, building them on first use."""
+    global _SETTINGS
+    settings = _SETTINGS
+    if settings is not None:
+        return settings
+    
+    # Built under the lock so a reload_config() cannot interleave: the flat
+    # view and the stored Settings always belong to the same load
+    with _CONFIG_LOCK:
+        settings = _SETTINGS
+        if settings is not None:
+            return settings
+        flat = _load_locked()[1]
+        override = _env_hooks_override(os.environ.get("AAA_METADATA_ENABLE_HOOKS", ""))
+        settings = _SETTINGS = Settings(
+            hooks_enabled=override if override is not None else flat.get("runtime_hooks.enabled", False),
+            debug=flat.get("debug.enabled", False),
+            hash_cache=flat.get("metadata.enable_hash_cache", True),
+            log_disagreements=flat.get("runtime_hooks.log_disagreements", False),
+            log_performance=flat.get("runtime_hooks.log_performance", False),
+            inline_limit_bytes=_parse_inline_limit(flat.get("runtime_hooks.inline_size_limit_kb", 32)),
+            snapshot_prompt=flat.get("runtime_hooks.snapshot_prompt", True),
+            max_sessions=_parse_max_sessions(flat.get("runtime_hooks.max_sessions", 256)),
+        )
+    return settings
+
+
+def _parse_inline_limit(value: Any) -> int:
+    """Convert runtime_hooks.inline_size_limit_kb to bytes, falling back to 32 KB if invalid."""
+    try:
+        # Through float so fractional sizes (0.5 -> 512 bytes) keep working
+        return int(float(value) * 1024)
+    except (TypeError, ValueError, OverflowError):
+        return 32 * 1024
+
+
+def _parse_max_sessions(value: Any) -> int:
+    """Coerce runtime_hooks.max_sessions to an int >= 1, falling back to 256 if invalid."""
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 256
+
+
+def _env_hooks_override(raw_value: str) -> Optional[bool]:
+    """Interpret AAA_METADATA_ENABLE_HOOKS; None means defer to config."""
+    env_value = raw_value.strip().lower()
+    if env_value in {"1", "true", "yes", "on"}:
+        return True
+    if env_value in {"0", "false", "no", "off"}:
+        return False
+    return None
+
+
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """
     Deep merge two dictionaries, with override values taking precedence.
@@ -88,15 +212,22 @@ def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any
     """
     result = base.copy()
     
-    for key, value in override.items():
-        # Skip comment fields
-        if key.startswith('_'):
-            continue
+    # (destination, override) pairs still to merge; a nested dict from base is
+    # copied only when an override actually descends into it
+    stack = [(result, override)]
+    while stack:
+        dest, source = stack.pop()
+        for key, value in source.items():
+            # Skip comment fields
+            if key.startswith('_'):
+                continue
             
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+            current = dest.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                current = dest[key] = current.copy()
+                stack.append((current, value))
+            else:
+                dest[key] = value
     
     return result
 
@@ -110,19 +241,13 @@ def get_runtime_hooks_enabled() -> bool:
     2. config.json runtime_hooks.enabled setting
     3. Default: False
     
+    The environment is read once with the config; call reload_config()
+    after changing it.
+    
     Returns:
         bool: True if runtime hooks should be enabled
     """
-    # Check environment variable first (highest priority)
-    env_value = os.environ.get("AAA_METADATA_ENABLE_HOOKS", "").strip().lower()
-    if env_value in {"1", "true", "yes", "on"}:
-        return True
-    if env_value in {"0", "false", "no", "off"}:
-        return False
-    
-    # Check config file
-    config = load_config()
-    return config.get("runtime_hooks", {}).get("enabled", False)
+    return _settings().hooks_enabled
 
 
 def get_debug_enabled() -> bool:
@@ -132,8 +257,7 @@ def get_debug_enabled() -> bool:
     Returns:
         bool: True if debug mode should be enabled
     """
-    config = load_config()
-    return config.get("debug", {}).get("enabled", False)
+    return _settings().debug
 
 
 def get_hash_cache_enabled() -> bool:
@@ -143,8 +267,7 @@ def get_hash_cache_enabled() -> bool:
     Returns:
         bool: True if hash caching should be enabled
     """
-    config = load_config()
-    return config.get("metadata", {}).get("enable_hash_cache", True)
+    return _settings().hash_cache
 
 
 def get_runtime_log_disagreements() -> bool:
@@ -154,8 +277,7 @@ def get_runtime_log_disagreements() -> bool:
     Returns:
         bool: True if disagreements should be logged
     """
-    config = load_config()
-    return config.get("runtime_hooks", {}).get("log_disagreements", False)
+    return _settings().log_disagreements
 
 
 def get_runtime_log_performance() -> bool:
@@ -165,8 +287,7 @@ def get_runtime_log_performance() -> bool:
     Returns:
         bool: True if performance should be logged
     """
-    config = load_config()
-    return config.get("runtime_hooks", {}).get("log_performance", False)
+    return _settings().log_performance
 
 
 def get_runtime_inline_limit() -> int:
@@ -176,9 +297,27 @@ def get_runtime_inline_limit() -> int:
     Returns:
         int: Size limit in bytes (default 32KB)
     """
-    config = load_config()
-    limit_kb = config.get("runtime_hooks", {}).get("inline_size_limit_kb", 32)
-    return limit_kb * 1024
+    return _settings().inline_limit_bytes
+
+
+def get_runtime_snapshot_prompt() -> bool:
+    """
+    Check if runtime hooks should snapshot the prompt when execution starts.
+    
+    Returns:
+        bool: True to store a copy of the prompt, False to keep a reference
+    """
+    return _settings().snapshot_prompt
+
+
+def get_runtime_max_sessions() -> int:
+    """
+    Get how many unconsumed runtime sessions to keep before evicting the oldest.
+    
+    Returns:
+        int: Maximum number of sessions (default 256, at least 1)
+    """
+    return _settings().max_sessions
 
 
 def reload_config() -> Dict[str, Any]:
@@ -188,12 +327,21 @@ def reload_config() -> Dict[str, Any]:
     Returns:
         dict: Reloaded configuration
     """
-    global _CONFIG_CACHE
-    _CONFIG_CACHE = None
+    global _CONFIG_CACHE, _FLAT, _SETTINGS
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE = None
+        _FLAT = None
+        _SETTINGS = None
+    try:
+        from ..hooks.runtime_capture import invalidate_config_cache
+        invalidate_config_cache()
+    except ImportError:
+        pass
     return load_config()
 
 
 __all__ = [
+    "Settings",
     "load_config",
     "get_config_path",
     "get_runtime_hooks_enabled",
@@ -202,5 +350,7 @@ __all__ = [
     "get_runtime_log_disagreements",
     "get_runtime_log_performance",
     "get_runtime_inline_limit",
+    "get_runtime_snapshot_prompt",
+    "get_runtime_max_sessions",
     "reload_config",
 ]
@@ -23,27 +23,50 @@ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
 PARTICULAR PURPOSE AND NONINFRINGEMENT.
 """
 
+import functools
 import hashlib
 import logging
 import os
-import string
+import re
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
-
-from PIL import Image
+from typing import Dict, Iterable, Optional, Union
 
 
 logger = logging.getLogger(__name__)
 
-# Check for imagehash library
-try:
-    import imagehash
-    IMAGEHASH_AVAILABLE = True
-except ImportError:
-    print("Warning: imagehash library not installed. To enable image hash functionality:")
-    print("pip install imagehash")
-    IMAGEHASH_AVAILABLE = False
+# PIL and imagehash are only needed for perceptual hashes, so they are
+# imported on the first such call rather than with the module (file hashing
+# of model checkpoints never pays for them)
+imagehash = None
+# Algorithm name -> imagehash function; anything else uses average_hash
+_IMAGE_HASH_FUNCTIONS = {}
+# None until the first perceptual-hash call has tried the import
+IMAGEHASH_AVAILABLE: Optional[bool] = None
+
+
+def _imagehash_available() -> bool:
+    global imagehash, _IMAGE_HASH_FUNCTIONS, IMAGEHASH_AVAILABLE
+    if IMAGEHASH_AVAILABLE is None:
+        try:
+            import imagehash as imagehash_module
+        except ImportError:
+            print("Warning: imagehash library not installed. To enable image hash functionality:")
+            print("pip install imagehash")
+            IMAGEHASH_AVAILABLE = False
+        else:
+            imagehash = imagehash_module
+            _IMAGE_HASH_FUNCTIONS = {
+                "phash": imagehash_module.phash,
+                "dhash": imagehash_module.dhash,
+                "whash-haar": imagehash_module.whash,
+                "average_hash": imagehash_module.average_hash,
+            }
+            IMAGEHASH_AVAILABLE = True
+    return IMAGEHASH_AVAILABLE
 
 def calculate_image_hash(image, hash_algorithm="phash"):
     """
@@ -56,20 +79,12 @@ def calculate_image_hash(image, hash_algorithm="phash"):
     Returns:
         str: String representation of the hash, or None if error
     """
-    if not IMAGEHASH_AVAILABLE:
+    if not _imagehash_available():
         return None
         
     try:
-        # Calculate hash based on selected algorithm
-        hash_value = None
-        if hash_algorithm == "phash":
-            hash_value = imagehash.phash(image)
-        elif hash_algorithm == "dhash":
-            hash_value = imagehash.dhash(image)
-        elif hash_algorithm == "whash-haar":
-            hash_value = imagehash.whash(image)
-        else:  # default to average_hash
-            hash_value = imagehash.average_hash(image)
+        # Calculate hash based on selected algorithm (default average_hash)
+        hash_value = _IMAGE_HASH_FUNCTIONS.get(hash_algorithm, imagehash.average_hash)(image)
             
         # Return string representation
         return str(hash_value)
@@ -82,6 +97,9 @@ def calculate_hash_from_file(file_path, hash_algorithm="phash"):
     """
     Calculate perceptual hash for an image file
     
+    Results are memoized per (path, mtime, size, algorithm); call
+    ``calculate_hash_from_file.cache_clear()`` to drop them.
+    
     Args:
         file_path: Path to image file
         hash_algorithm: Hash algorithm to use
@@ -89,18 +107,33 @@ def calculate_hash_from_file(file_path, hash_algorithm="phash"):
     Returns:
         str: String representation of the hash, or None if error
     """
-    if not IMAGEHASH_AVAILABLE:
+    if not _imagehash_available():
         return None
         
     try:
-        # Open image
-        img = Image.open(file_path)
-        # Calculate hash
-        return calculate_image_hash(img, hash_algorithm)
+        # Key the cache on the file's identity so edits miss it automatically
+        path_str = os.path.abspath(os.fspath(file_path))
+        file_stat = os.stat(path_str)
+        return _cached_file_hash(path_str, file_stat.st_mtime_ns, file_stat.st_size, hash_algorithm)
     except Exception as e:
         print(f"Error calculating hash from file {file_path}: {e}")
         return None
 
+
+@functools.lru_cache(maxsize=4096)
+def _cached_file_hash(path_str, mtime_ns, size, hash_algorithm):
+    """Decode and hash an image file; failures raise so they are never cached."""
+    from PIL import Image
+
+    with Image.open(path_str) as img:
+        hash_value = calculate_image_hash(img, hash_algorithm)
+    if hash_value is None:
+        raise ValueError("image hash could not be calculated")
+    return hash_value
+
+
+calculate_hash_from_file.cache_clear = _cached_file_hash.cache_clear
+
 def save_hash_to_metadata(file_path, hash_value, hash_algorithm, metadata_service):
     """
     Save hash value to image metadata
@@ -183,15 +216,116 @@ def calculate_and_save_hash(image_or_path, file_path, metadata_service, hash_alg
         return None
 
 
+# fullmatch rather than bytes.fromhex, which would accept embedded spaces
+_HEX_DIGEST_RE = re.compile(r"[0-9a-fA-F]{64}")
+
+
 def _is_valid_sha256_digest(value: str) -> bool:
     """Quick validation for cached SHA256 strings."""
-    if len(value) != 64:
-        return False
-    return all(ch in string.hexdigits for ch in value)
+    return _HEX_DIGEST_RE.fullmatch(value) is not None
+
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+_FILE_HASH_ALGORITHMS = ("sha256", "blake3")
+
+# blake3 is optional and only imported the first time it is requested;
+# False marks an import that already failed
+_BLAKE3_MODULE = None
+
+
+def _load_blake3():
+    global _BLAKE3_MODULE
+    if _BLAKE3_MODULE is None:
+        try:
+            import blake3
+            _BLAKE3_MODULE = blake3
+        except ImportError:
+            _BLAKE3_MODULE = False
+    return _BLAKE3_MODULE or None
+
+
+def _sha256_of_handle(handle) -> str:
+    """Hash the rest of a binary file handle, looping in C where available."""
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+    sha256_hash = hashlib.new("sha256")
+    read = handle.read
+    update = sha256_hash.update
+    for chunk in iter(lambda: read(_HASH_CHUNK_SIZE), b""):
+        update(chunk)
+    return sha256_hash.hexdigest()
+
+
+def _blake3_of_handle(blake3_module, handle, path: str) -> str:
+    """Hash a file with BLAKE3, memory-mapped and multithreaded when supported."""
+    hasher = blake3_module.blake3(max_threads=blake3_module.blake3.AUTO)
+    if hasattr(hasher, "update_mmap"):
+        return hasher.update_mmap(path).hexdigest()
+
+    read = handle.read
+    update = hasher.update
+    for chunk in iter(lambda: read(_HASH_CHUNK_SIZE), b""):
+        update(chunk)
+    return hasher.hexdigest()
+
+
+def _read_cached_digest(cache_path: str, source_stat: os.stat_result) -> Optional[str]:
+    """Return the sidecar digest if it is still valid for the source file.
+
+    Sidecars hold the bare hex digest and are valid when the sidecar itself
+    is not older than the source. Only the first whitespace-separated field
+    is read, so ``sha256sum``-style ``"<digest>  <name>"`` lines also work.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            # fstat of the open sidecar: one open instead of exists + stat + read
+            if os.fstat(cache_file.fileno()).st_mtime < source_stat.st_mtime:
+                return None
+            fields = cache_file.read().split(None, 1)
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        logger.debug("hash_file_sha256: Failed to read cache %s (%s)", cache_path, exc)
+        return None
+
+    if not fields or not _is_valid_sha256_digest(fields[0]):
+        logger.debug("hash_file_sha256: Invalid cache contents in %s", cache_path)
+        return None
+
+    return fields[0].lower()
+
+
+def _write_cache_atomic(cache_path: str, digest: str) -> None:
+    """Write a digest sidecar via a temp file and rename.
+
+    Readers never see a truncated sidecar, and concurrent writers each
+    rename a complete file into place. No fsync: a lost cache is recomputed.
+    """
+    tmp_path = f"{cache_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, (digest + "\n").encode("ascii"))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
-def hash_file_sha256(file_path: Union[str, Path], use_cache: bool = True) -> Optional[str]:
-    """Compute a SHA256 hash for ``file_path`` with optional sidecar caching.
+def hash_file_sha256(
+    file_path: Union[str, Path],
+    use_cache: bool = True,
+    algorithm: str = "sha256",
+) -> Optional[str]:
+    """Compute a SHA256 (or BLAKE3) hash for ``file_path`` with optional sidecar caching.
 
     The cache keeps a ``.sha256`` file next to the original resource and is
     considered valid when its mtime is not older than the source file. Invalid
@@ -202,49 +336,117 @@ def hash_file_sha256(file_path: Union[str, Path], use_cache: bool = True) -> Opt
         use_cache: Whether to consult and persist the optional ``.sha256``
             sidecar. Set to ``False`` to force a live recompute without writing
             cache data.
+        algorithm: ``"sha256"`` (default) or ``"blake3"``. BLAKE3 needs the
+            optional ``blake3`` package and caches to a ``.blake3`` sidecar.
 
     Returns:
         The 64-character hexadecimal digest, or ``None`` when the file does not
-        exist or hashing fails for any reason.
+        exist, the requested algorithm is unavailable, or hashing fails for any
+        reason.
+
+    Raises:
+        ValueError: If ``algorithm`` is not one of the supported names.
     """
 
-    path = Path(file_path)
+    if algorithm not in _FILE_HASH_ALGORITHMS:
+        raise ValueError(
+            f"Unsupported file hash algorithm {algorithm!r}; expected one of {_FILE_HASH_ALGORITHMS}"
+        )
 
-    if not path.exists() or not path.is_file():
-        logger.warning("hash_file_sha256: Path does not exist or is not a file: %s", path)
-        return None
+    blake3_module = None
+    if algorithm == "blake3":
+        blake3_module = _load_blake3()
+        if blake3_module is None:
+            logger.warning("hash_file_sha256: blake3 requested but not installed (pip install blake3)")
+            return None
 
-    cache_path = path.with_suffix(path.suffix + ".sha256")
+    # Plain strings and os calls throughout; pathlib adds object churn per file
+    path = os.fspath(file_path)
+
+    # Opening is the existence check; the source mtime comes from the open
+    # descriptor, so the source file is never stat'ed by path. Unbuffered,
+    # as the digest loop reads in large chunks anyway
+    try:
+        handle = open(path, "rb", buffering=0)
+    except OSError as exc:
+        logger.warning("hash_file_sha256: Path does not exist or is not a file: %s (%s)", path, exc)
+        return None
 
-    if use_cache and cache_path.exists():
+    with handle:
         try:
-            cache_mtime = cache_path.stat().st_mtime
-            source_mtime = path.stat().st_mtime
+            source_stat = os.fstat(handle.fileno())
+        except OSError as exc:
+            logger.error("hash_file_sha256: Failed hashing %s (%s)", path, exc)
+            return None
 
-            if cache_mtime >= source_mtime:
-                cached_value = cache_path.read_text(encoding="utf-8").strip()
-                if _is_valid_sha256_digest(cached_value):
-                    return cached_value.lower()
+        if not stat.S_ISREG(source_stat.st_mode):
+            logger.warning("hash_file_sha256: Path does not exist or is not a file: %s", path)
+            return None
 
-                logger.debug("hash_file_sha256: Invalid cache contents in %s", cache_path)
+        cache_path = f"{path}.{algorithm}"
+
+        if use_cache:
+            cached_digest = _read_cached_digest(cache_path, source_stat)
+            if cached_digest is not None:
+                return cached_digest
+
+        try:
+            if blake3_module is not None:
+                digest = _blake3_of_handle(blake3_module, handle, path)
+            else:
+                digest = _sha256_of_handle(handle)
         except OSError as exc:
-            logger.debug("hash_file_sha256: Failed to read cache %s (%s)", cache_path, exc)
+            logger.error("hash_file_sha256: Failed hashing %s (%s)", path, exc)
+            return None
 
-    try:
-        sha256_hash = hashlib.sha256()
-        with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(8192), b""):
-                sha256_hash.update(chunk)
+    if use_cache:
+        try:
+            _write_cache_atomic(cache_path, digest)
+        except OSError as exc:
+            logger.debug("hash_file_sha256: Unable to write cache %s (%s)", cache_path, exc)
 
-        digest = sha256_hash.hexdigest()
+    return digest
 
-        if use_cache:
-            try:
-                cache_path.write_text(digest + "\n", encoding="utf-8")
-            except OSError as exc:
-                logger.debug("hash_file_sha256: Unable to write cache %s (%s)", cache_path, exc)
 
-        return digest
-    except OSError as exc:
-        logger.error("hash_file_sha256: Failed hashing %s (%s)", path, exc)
-        return None
\ No newline at end of file
+def hash_files_sha256(
+    file_paths: Iterable[Union[str, Path]],
+    use_cache: bool = True,
+    algorithm: str = "sha256",
+    max_workers: Optional[int] = None,
+) -> Dict[Union[str, Path], Optional[str]]:
+    """Hash many files concurrently with :func:`hash_file_sha256`.
+
+    hashlib (and blake3) release the GIL while digesting large buffers, so
+    worker threads overlap both the reads and the hashing of different files.
+
+    Args:
+        file_paths: Paths to hash; duplicates are hashed once.
+        use_cache: Passed through to :func:`hash_file_sha256`.
+        algorithm: Passed through to :func:`hash_file_sha256`.
+        max_workers: Thread count; defaults to ``min(32, cpu_count * 4)``.
+
+    Returns:
+        A dict mapping each given path to its digest, or ``None`` for files
+        that could not be hashed.
+
+    Raises:
+        ValueError: If ``algorithm`` is not supported.
+    """
+
+    unique_paths = list(dict.fromkeys(file_paths))
+    if not unique_paths:
+        return {}
+    if algorithm not in _FILE_HASH_ALGORITHMS:
+        raise ValueError(
+            f"Unsupported file hash algorithm {algorithm!r}; expected one of {_FILE_HASH_ALGORITHMS}"
+        )
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    max_workers = max(1, min(max_workers, len(unique_paths)))
+
+    def _hash_one(file_path):
+        return hash_file_sha256(file_path, use_cache=use_cache, algorithm=algorithm)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aaa-hash") as executor:
+        return dict(zip(unique_paths, executor.map(_hash_one, unique_paths)))
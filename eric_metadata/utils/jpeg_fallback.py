@@ -11,13 +11,46 @@ Date: 2025-11-18
 """
 
 import json
+from json.encoder import encode_basestring
 from typing import Dict, Any, Tuple, Optional
-from copy import deepcopy
 
 
 # JPEG EXIF has practical limits - Adobe recommends staying under 60KB for compatibility
 JPEG_EXIF_SIZE_THRESHOLD = 60 * 1024  # 60KB in bytes
 
+# (dotted path, fields) copied by trim_to_essential, in output order; LoRAs
+# and embeddings are kept whole as they are usually small
+_ESSENTIAL_SCHEMA = tuple((tuple(path.split('.')), fields) for path, fields in (
+    ('basic', ('title', 'creator', 'timestamp')),
+    ('ai_info.generation', ('prompt', 'negative_prompt', 'seed', 'steps', 'cfg_scale',
+                            'sampler', 'scheduler', 'width', 'height', 'denoise', 'timestamp')),
+    ('ai_info.generation.base_model', ('name', 'hash', 'checkpoint')),
+    ('ai_info.generation.sampling', ('sampler', 'scheduler', 'steps', 'cfg_scale', 'seed', 'denoise')),
+    ('ai_info.generation.dimensions', ('width', 'height', 'batch_size')),
+    ('ai_info.generation', ('loras', 'embeddings')),
+    ('provenance', ('created_by', 'created_at', 'source', 'capture_mode')),
+))
+
+_STAGE_NAMES = {
+    1: 'full',
+    2: 'reduced',
+    3: 'minimal',
+    4: 'sidecar'
+}
+
+_STAGE_DESCRIPTIONS = {
+    1: 'Full metadata embedded',
+    2: 'Workflow JSON removed to reduce size',
+    3: 'Only essential fields embedded',
+    4: 'Minimal EXIF with pointer to sidecar file'
+}
+
+# Built once; json.dumps would construct an equivalent encoder per call
+_SIZE_ENCODER = json.JSONEncoder(default=str, ensure_ascii=False)
+
+# Workflow-related fields dropped from ai_info.generation in Stage 2
+_WORKFLOW_KEYS = frozenset(('workflow', 'workflow_data', 'workflow_api'))
+
 
 def estimate_metadata_size(metadata: Dict[str, Any]) -> int:
     """
@@ -34,13 +67,71 @@ def estimate_metadata_size(metadata: Dict[str, Any]) -> int:
     """
     try:
         # Serialize to JSON to get approximate size
-        json_str = json.dumps(metadata, default=str, ensure_ascii=False)
-        return len(json_str.encode('utf-8'))
+        return _encoded_size(metadata)
     except Exception:
         # If serialization fails, return a large number to trigger fallback
         return JPEG_EXIF_SIZE_THRESHOLD + 1
 
 
+# Dicts sized key by key (root, ai_info, ai_info.generation) so the stages'
+# candidates, which differ only inside them, reuse the sizes of shared values
+_COMPOSED_SIZE_PATHS: Dict[str, Any] = {'ai_info': {'generation': {}}}
+
+
+def _encoded_size(obj: Any) -> int:
+    return len(_SIZE_ENCODER.encode(obj).encode('utf-8'))
+
+
+def _key_size(key: Any) -> int:
+    if isinstance(key, str):
+        return len(encode_basestring(key).encode('utf-8'))
+    # Encoding {key: None} applies json's key coercion; 8 == len('{: null}')
+    return _encoded_size({key: None}) - 8
+
+
+def _composed_size(obj: Any, memo: Dict[int, Tuple[Any, int]],
+                   paths: Optional[Dict[str, Any]] = _COMPOSED_SIZE_PATHS,
+                   limit: Optional[int] = None) -> int:
+    """
+    Size ``obj`` exactly as ``estimate_metadata_size`` would, reusing the
+    sizes of values already measured (memo is keyed by object identity).
+    
+    With ``limit``, a composed dict stops summing once its running total
+    exceeds it and returns that partial total, which is only known to be
+    larger than ``limit``. Partial totals are never memoized.
+    
+    Raises:
+        Any serialization error; callers treat it as "too large".
+    """
+    cached = memo.get(id(obj))
+    if cached is not None and cached[0] is obj:
+        return cached[1]
+    
+    if paths is not None and isinstance(obj, dict) and obj:
+        # "{" + items joined by ", " + "}", each item being key + ": " + value
+        size = 2 * len(obj)
+        for key, value in obj.items():
+            subpaths = paths.get(key) if isinstance(key, str) else None
+            size += _key_size(key) + 2
+            size += _composed_size(value, memo, subpaths, None if limit is None else limit - size)
+            if limit is not None and size > limit:
+                return size
+    else:
+        size = _encoded_size(obj)
+    
+    memo[id(obj)] = (obj, size)
+    return size
+
+
+def _stage_size(metadata: Dict[str, Any], memo: Dict[int, Tuple[Any, int]], limit: int) -> int:
+    """Exact size of ``metadata`` if it fits in ``limit``, else some value above it."""
+    try:
+        return _composed_size(metadata, memo, limit=limit)
+    except Exception:
+        # Same fallback as estimate_metadata_size: too large to embed
+        return limit + 1
+
+
 def trim_to_essential(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
     Trim metadata to essential fields only for minimal EXIF embedding.
@@ -60,69 +151,31 @@ def trim_to_essential(metadata: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Trimmed metadata with only essential fields
     """
-    essential = {}
-    
-    # Basic metadata (if present)
-    if 'basic' in metadata:
-        basic = metadata['basic']
-        essential['basic'] = {}
-        for key in ['title', 'creator', 'timestamp']:
-            if key in basic:
-                essential['basic'][key] = basic[key]
-    
-    # AI generation info (essential parameters only)
-    if 'ai_info' in metadata and 'generation' in metadata['ai_info']:
-        gen = metadata['ai_info']['generation']
-        essential['ai_info'] = {'generation': {}}
-        ess_gen = essential['ai_info']['generation']
-        
-        # Direct fields
-        for key in ['prompt', 'negative_prompt', 'seed', 'steps', 'cfg_scale', 
-                    'sampler', 'scheduler', 'width', 'height', 'denoise', 'timestamp']:
-            if key in gen:
-                ess_gen[key] = gen[key]
-        
-        # Model info
-        if 'base_model' in gen:
-            model = gen['base_model']
-            ess_gen['base_model'] = {}
-            for key in ['name', 'hash', 'checkpoint']:
-                if key in model:
-                    ess_gen['base_model'][key] = model[key]
-        
-        # Sampling parameters (if grouped)
-        if 'sampling' in gen:
-            sampling = gen['sampling']
-            ess_gen['sampling'] = {}
-            for key in ['sampler', 'scheduler', 'steps', 'cfg_scale', 'seed', 'denoise']:
-                if key in sampling:
-                    ess_gen['sampling'][key] = sampling[key]
-        
-        # Dimensions (if grouped)
-        if 'dimensions' in gen:
-            dims = gen['dimensions']
-            ess_gen['dimensions'] = {}
-            for key in ['width', 'height', 'batch_size']:
-                if key in dims:
-                    ess_gen['dimensions'][key] = dims[key]
-        
-        # LoRAs
-        if 'loras' in gen:
-            ess_gen['loras'] = gen['loras']  # Keep all LoRA info as it's usually small
-        
-        # Embeddings
-        if 'embeddings' in gen:
-            ess_gen['embeddings'] = gen['embeddings']
-    
-    # Provenance (for traceability)
-    if 'provenance' in metadata:
-        prov = metadata['provenance']
-        essential['provenance'] = {}
-        for key in ['created_by', 'created_at', 'source', 'capture_mode']:
-            if key in prov:
-                essential['provenance'][key] = prov[key]
+    return _project(metadata, _ESSENTIAL_SCHEMA)
+
+
+def _project(source: Dict[str, Any], schema: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...]) -> Dict[str, Any]:
+    """
+    Copy the listed fields of each schema path that exists in ``source``.
     
-    return essential
+    A path's destination dicts are created as soon as the path exists, even
+    when none of its fields are present.
+    """
+    result: Dict[str, Any] = {}
+    for path, fields in schema:
+        node = source
+        for part in path:
+            if part not in node:
+                break
+            node = node[part]
+        else:
+            dest = result
+            for part in path:
+                dest = dest.setdefault(part, {})
+            for key in fields:
+                if key in node:
+                    dest[key] = node[key]
+    return result
 
 
 def create_reduced_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -136,24 +189,24 @@ def create_reduced_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
         metadata: Full metadata dictionary
         
     Returns:
-        Metadata without workflow JSON
+        Metadata without workflow JSON. Only the dicts along the pruned paths
+        (and ``provenance``) are new; all other values are shared with
+        ``metadata``.
     """
-    reduced = deepcopy(metadata)
-    
-    # Remove workflow data (largest contributor to metadata size)
-    if 'ai_info' in reduced and 'workflow' in reduced['ai_info']:
-        del reduced['ai_info']['workflow']
+    reduced = {k: v for k, v in metadata.items() if k != 'analysis'}  # can be regenerated
     
-    if 'ai_info' in reduced and 'generation' in reduced['ai_info']:
-        gen = reduced['ai_info']['generation']
-        # Remove workflow-related fields
-        for key in ['workflow', 'workflow_data', 'workflow_api']:
-            if key in gen:
-                del gen[key]
+    ai_info = reduced.get('ai_info')
+    if isinstance(ai_info, dict):
+        # Remove workflow data (largest contributor to metadata size)
+        ai_info = {k: v for k, v in ai_info.items() if k != 'workflow'}
+        gen = ai_info.get('generation')
+        if isinstance(gen, dict):
+            ai_info['generation'] = {k: v for k, v in gen.items() if k not in _WORKFLOW_KEYS}
+        reduced['ai_info'] = ai_info
     
-    # Remove analysis data (can be regenerated)
-    if 'analysis' in reduced:
-        del reduced['analysis']
+    # add_fallback_provenance writes into this dict, so it must not be shared
+    if isinstance(reduced.get('provenance'), dict):
+        reduced['provenance'] = dict(reduced['provenance'])
     
     return reduced
 
@@ -173,20 +226,24 @@ def determine_fallback_stage(metadata: Dict[str, Any],
         - metadata_to_use: The metadata dict that should be written
         - estimated_size: Estimated size in bytes of the metadata
     """
+    # Values shared between the stages' candidates are serialized only once
+    size_memo: Dict[int, Tuple[Any, int]] = {}
+    
     # Stage 1: Try full metadata
-    full_size = estimate_metadata_size(metadata)
+    full_size = _stage_size(metadata, size_memo, threshold)
     if full_size <= threshold:
         return (1, metadata, full_size)
     
     # Stage 2: Try reduced (no workflow)
     reduced = create_reduced_metadata(metadata)
-    reduced_size = estimate_metadata_size(reduced)
+    reduced_size = _stage_size(reduced, size_memo, threshold)
     if reduced_size <= threshold:
         return (2, reduced, reduced_size)
     
-    # Stage 3: Try minimal (essential only)
-    minimal = trim_to_essential(metadata)
-    minimal_size = estimate_metadata_size(minimal)
+    # Stage 3: Try minimal (essential only). No essential field lies under the
+    # keys Stage 2 dropped, so trimming the smaller reduced dict is equivalent
+    minimal = trim_to_essential(reduced)
+    minimal_size = _stage_size(minimal, size_memo, threshold)
     if minimal_size <= threshold:
         return (3, minimal, minimal_size)
     
@@ -219,28 +276,13 @@ def add_fallback_provenance(metadata: Dict[str, Any], stage: int,
     Returns:
         Updated metadata with provenance info
     """
-    if 'provenance' not in metadata:
-        metadata['provenance'] = {}
-    
-    stage_names = {
-        1: 'full',
-        2: 'reduced',
-        3: 'minimal',
-        4: 'sidecar'
-    }
-    
-    metadata['provenance']['jpeg_fallback_stage'] = stage
-    metadata['provenance']['jpeg_fallback_stage_name'] = stage_names.get(stage, 'unknown')
-    metadata['provenance']['jpeg_metadata_size_original'] = original_size
-    metadata['provenance']['jpeg_metadata_size_final'] = final_size
-    
-    # Add description of what was done
-    descriptions = {
-        1: 'Full metadata embedded',
-        2: 'Workflow JSON removed to reduce size',
-        3: 'Only essential fields embedded',
-        4: 'Minimal EXIF with pointer to sidecar file'
-    }
-    metadata['provenance']['jpeg_fallback_description'] = descriptions.get(stage, 'Unknown fallback')
+    metadata.setdefault('provenance', {}).update({
+        'jpeg_fallback_stage': stage,
+        'jpeg_fallback_stage_name': _STAGE_NAMES.get(stage, 'unknown'),
+        'jpeg_metadata_size_original': original_size,
+        'jpeg_metadata_size_final': final_size,
+        # Description of what was done
+        'jpeg_fallback_description': _STAGE_DESCRIPTIONS.get(stage, 'Unknown fallback'),
+    })
     
     return metadata
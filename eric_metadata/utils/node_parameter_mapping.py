@@ -26,6 +26,8 @@ This code depends on several third-party libraries, each with its own license:
 
 """
 
+import sys
+from collections import namedtuple
 from typing import Dict, Any, List, Optional, Tuple, Set
 import datetime
 
@@ -214,12 +216,110 @@ NODE_PARAMETER_MAPPING = {
     "LoadImage.image": ["ai_info", "generation", "reference", "image"]
 }
 
+# How extract_by_parameter_mapping stores a mapped parameter
+PATH_REGULAR = 0      # set at its path in the metadata
+PATH_LORA = 1         # grouped per node into ai_info.generation.loras
+PATH_CONTROLNET = 2   # grouped per node into ai_info.generation.controlnets
+
+# A mapping path split once into its parent keys, leaf key and storage kind
+PathSpec = namedtuple("PathSpec", ["parents", "leaf", "kind"])
+
+
+def _path_spec(path: List[str]) -> PathSpec:
+    parents = tuple(path[:-1])
+    if parents == ("ai_info", "generation", "loras"):
+        kind = PATH_LORA
+    elif parents == ("ai_info", "generation", "control_nets"):
+        kind = PATH_CONTROLNET
+    else:
+        kind = PATH_REGULAR
+    return PathSpec(parents, path[-1], kind)
+
+
+# NODE_PARAMETER_MAPPING regrouped by node type, then parameter name, so
+# extraction does two plain lookups instead of building "type.param" keys
+NODE_TYPE_INDEX: Dict[str, Dict[str, PathSpec]] = {}
+for _lookup_key, _path in NODE_PARAMETER_MAPPING.items():
+    _node_type, _, _param_name = _lookup_key.rpartition(".")
+    # Interned so lookups with interned workflow strings match on identity
+    NODE_TYPE_INDEX.setdefault(sys.intern(_node_type), {})[sys.intern(_param_name)] = _path_spec(_path)
+del _lookup_key, _path, _node_type, _param_name
+
+# CLIPTextEncode.text is redirected here when the node's title marks it negative
+_NEGATIVE_PROMPT_SPEC = _path_spec(["ai_info", "generation", "negative_prompt"])
+
+# Loader nodes whose lora_<n>_* slots are collected into ai_info.generation.loras
+MULTI_LORA_NODE_TYPES = frozenset({'Multi-LoRA Loader v02', 'MultiLoRALoaderWithFiltering'})
+
+# (enable, name, strength, clip strength) input keys of Multi-LoRA slots 1-8
+_MULTI_LORA_SLOT_KEYS = tuple(
+    (f'lora_{i}_enable', f'lora_{i}_name', f'lora_{i}_strength', f'lora_{i}_clip_strength')
+    for i in range(1, 9)
+)
+
+# Node type -> input(s), in priority order, holding the value a reference to
+# that node resolves to
+REF_RESOLVERS: Dict[str, Tuple[str, ...]] = {
+    'PrimitiveNode': ('value',),
+    'StringNode': ('string',),
+    # Text Multiline nodes (commonly used for prompts)
+    'Text Multiline': ('text',),
+    'TextMultiline': ('text',),
+    'String': ('String', 'string'),
+    'SamplerNode': ('sampler_name',),
+    'SchedulerNode': ('scheduler',),
+}
+
 # Parameters that should be treated as negative prompts if found
 NEGATIVE_PROMPT_INDICATORS = [
     "negative",
     "neg"
 ]
 
+def _extract_power_loras(inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Collect the enabled LoRAs of a Power Lora Loader (rgthree) node."""
+    loras = []
+    
+    # Parse the special Power Lora format
+    for key, value in inputs.items():
+        if key.startswith('lora_') and isinstance(value, dict):
+            # Check if lora is enabled
+            if value.get('on', False) and value.get('lora'):
+                loras.append({
+                    'name': value['lora'],
+                    'strength': value.get('strength', 1.0)
+                })
+    
+    return loras
+
+def _extract_multi_loras(inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Collect the enabled LoRA slots of a Multi-LoRA Loader node."""
+    loras = []
+    
+    # Process 8 possible LoRA slots
+    for i, (enable_key, name_key, strength_key, clip_strength_key) in enumerate(_MULTI_LORA_SLOT_KEYS, 1):
+        # Check if this slot is enabled and has a LoRA
+        if (inputs.get(enable_key, False) and 
+            inputs.get(name_key, 'None') != 'None'):
+            
+            loras.append({
+                'name': inputs.get(name_key, ''),
+                'strength': inputs.get(strength_key, 1.0),
+                'clip_strength': inputs.get(clip_strength_key, 1.0),
+                'slot': i
+            })
+    
+    return loras
+
+def _parent_dict(parent_cache: Dict[Tuple[str, ...], Dict[str, Any]],
+                 parents: Tuple[str, ...]) -> Dict[str, Any]:
+    """Return (creating if needed) the dict at ``parents``, memoized per path."""
+    parent = parent_cache.get(parents)
+    if parent is None:
+        parent = _parent_dict(parent_cache, parents[:-1]).setdefault(parents[-1], {})
+        parent_cache[parents] = parent
+    return parent
+
 def extract_by_parameter_mapping(nodes: Dict[str, Any], debug: bool = False) -> Dict[str, Any]:
     """
     Extract metadata using direct node parameter mapping
@@ -242,82 +342,46 @@ def extract_by_parameter_mapping(nodes: Dict[str, Any], debug: bool = False) ->
         for node_type, params in discovered.items():
             print(f"  {node_type}: {', '.join(params)}")
     
-    # Special handling for Power Lora Loader (complex structure)
+    # LoRAs from loaders with their own input layouts, gathered in the main pass
     power_loras = []
-    for node_id, node in nodes.items():
-        if node.get('class_type', '') == 'Power Lora Loader (rgthree)':
-            inputs = node.get('inputs', {})
-            
-            # Parse the special Power Lora format
-            for key, value in inputs.items():
-                if key.startswith('lora_') and isinstance(value, dict):
-                    # Check if lora is enabled
-                    if value.get('on', False) and value.get('lora'):
-                        lora = {
-                            'name': value['lora'],
-                            'strength': value.get('strength', 1.0)
-                        }
-                        power_loras.append(lora)
-            
-            if debug and power_loras:
-                print(f"[NodeParameterMapping] Extracted {len(power_loras)} LoRAs from Power Lora Loader")
-    
-    # Add Power Loras to metadata if found
-    if power_loras:
-        if "ai_info" not in metadata:
-            metadata["ai_info"] = {}
-        if "generation" not in metadata["ai_info"]:
-            metadata["ai_info"]["generation"] = {}
-        metadata["ai_info"]["generation"]["loras"] = power_loras
-
-    # Special handling for Multi-LoRA Loader v02
     multi_loras = []
-    for node_id, node in nodes.items():
-        node_class = node.get('class_type', '')
-        if node_class in ['Multi-LoRA Loader v02', 'MultiLoRALoaderWithFiltering']:
-            inputs = node.get('inputs', {})
-            
-            # Process 8 possible LoRA slots
-            for i in range(1, 9):
-                enable_key = f'lora_{i}_enable'
-                name_key = f'lora_{i}_name'
-                strength_key = f'lora_{i}_strength'
-                clip_strength_key = f'lora_{i}_clip_strength'
-                
-                # Check if this slot is enabled and has a LoRA
-                if (inputs.get(enable_key, False) and 
-                    inputs.get(name_key, 'None') != 'None'):
-                    
-                    lora = {
-                        'name': inputs.get(name_key, ''),
-                        'strength': inputs.get(strength_key, 1.0),
-                        'clip_strength': inputs.get(clip_strength_key, 1.0),
-                        'slot': i
-                    }
-                    multi_loras.append(lora)
-            
-            if debug and multi_loras:
-                print(f"[NodeParameterMapping] Extracted {len(multi_loras)} LoRAs from {node_class}")
-
-    # Add Multi-LoRA Loader LoRAs to metadata if found
-    if multi_loras:
-        if "ai_info" not in metadata:
-            metadata["ai_info"] = {}
-        if "generation" not in metadata["ai_info"]:
-            metadata["ai_info"]["generation"] = {}
-        # If we already have loras from Power Lora Loader, extend the list
-        if "loras" in metadata["ai_info"]["generation"]:
-            metadata["ai_info"]["generation"]["loras"].extend(multi_loras)
-        else:
-            metadata["ai_info"]["generation"]["loras"] = multi_loras
+    
+    # Destination dict for each parent path already walked; no mapped path
+    # ends where another one continues, so cached dicts are never replaced
+    parent_cache: Dict[Tuple[str, ...], Dict[str, Any]] = {(): metadata}
     
     # Process all nodes
     for node_id, node in nodes.items():
         node_type = node.get('class_type', '')
+        if type(node_type) is str:
+            # One intern per node lets every index probe below hit by identity
+            node_type = sys.intern(node_type)
+        
+        # Special handling for Power Lora Loader (complex structure)
+        if node_type == 'Power Lora Loader (rgthree)':
+            power_loras.extend(_extract_power_loras(node.get('inputs', {})))
+            if debug and power_loras:
+                print(f"[NodeParameterMapping] Extracted {len(power_loras)} LoRAs from Power Lora Loader")
+        
+        # Special handling for Multi-LoRA Loader v02 (its slots are also mapped below)
+        elif node_type in MULTI_LORA_NODE_TYPES:
+            multi_loras.extend(_extract_multi_loras(node.get('inputs', {})))
+            if debug and multi_loras:
+                print(f"[NodeParameterMapping] Extracted {len(multi_loras)} LoRAs from {node_type}")
+        
+        # Skip whole node types with no mapping (custom and utility nodes)
+        # with one lookup instead of probing each of their parameters
+        param_map = NODE_TYPE_INDEX.get(node_type)
+        if param_map is None:
+            if debug and node_type:
+                for param_name in node.get('inputs', {}):
+                    print(f"[NodeParameterMapping] No mapping for: {node_type}.{param_name}")
+            continue
+        
         inputs = node.get('inputs', {})
         
-        # Skip if no inputs or no node type
-        if not inputs or not node_type:
+        # Skip if no inputs
+        if not inputs:
             continue
         
         # Check if this is a negative prompt node
@@ -325,16 +389,14 @@ def extract_by_parameter_mapping(nodes: Dict[str, Any], debug: bool = False) ->
         if node_type == "CLIPTextEncode" and '_meta' in node and 'title' in node['_meta']:
             title = node['_meta']['title'].lower()
             is_negative_prompt = any(indicator in title for indicator in NEGATIVE_PROMPT_INDICATORS)
-            
+        
         # Process all parameters
         for param_name, param_value in inputs.items():
-            # Create the lookup key
-            lookup_key = f"{node_type}.{param_name}"
-            
-            # Skip if not in our mapping
-            if lookup_key not in NODE_PARAMETER_MAPPING:
+            # Get metadata path, skipping parameters not in our mapping
+            spec = param_map.get(param_name)
+            if spec is None:
                 if debug:
-                    print(f"[NodeParameterMapping] No mapping for: {lookup_key}")
+                    print(f"[NodeParameterMapping] No mapping for: {node_type}.{param_name}")
                 continue
                 
             # Try to resolve references
@@ -343,21 +405,20 @@ def extract_by_parameter_mapping(nodes: Dict[str, Any], debug: bool = False) ->
                 resolved_value = resolve_reference(param_value, nodes)
                 if resolved_value == param_value:  # If resolution failed
                     if debug:
-                        print(f"[NodeParameterMapping] Couldn't resolve reference: {lookup_key} = {param_value}")
+                        print(f"[NodeParameterMapping] Couldn't resolve reference: {node_type}.{param_name} = {param_value}")
                     continue
                 param_value = resolved_value
-                
-            # Get metadata path
-            path = NODE_PARAMETER_MAPPING[lookup_key]
             
             # Special handling for prompt
-            if lookup_key == "CLIPTextEncode.text":
+            if param_name == "text" and node_type == "CLIPTextEncode":
                 if is_negative_prompt:
                     # Override path for negative prompt
-                    path = ["ai_info", "generation", "negative_prompt"]
+                    spec = _NEGATIVE_PROMPT_SPEC
+            
+            kind = spec.kind
             
             # Special handling for LoRAs
-            if path[:-1] == ["ai_info", "generation", "loras"]:
+            if kind == PATH_LORA:
                 # Group LoRA parameters by node ID
                 if node_id not in lora_nodes:
                     lora_nodes[node_id] = {
@@ -367,11 +428,11 @@ def extract_by_parameter_mapping(nodes: Dict[str, Any], debug: bool = False) ->
                     }
                 
                 # Store parameter value
-                lora_nodes[node_id][path[-1]] = param_value
+                lora_nodes[node_id][spec.leaf] = param_value
                 continue
                 
             # Special handling for ControlNets
-            if path[:-1] == ["ai_info", "generation", "control_nets"]:
+            if kind == PATH_CONTROLNET:
                 # Group ControlNet parameters by node ID
                 if node_id not in controlnet_nodes:
                     controlnet_nodes[node_id] = {
@@ -380,20 +441,15 @@ def extract_by_parameter_mapping(nodes: Dict[str, Any], debug: bool = False) ->
                     }
                 
                 # Store parameter value
-                controlnet_nodes[node_id][path[-1]] = param_value
+                controlnet_nodes[node_id][spec.leaf] = param_value
                 continue
             
-            # Regular parameter - set in metadata
-            current = metadata
-            
-            # Create path
-            for i, path_part in enumerate(path[:-1]):
-                if path_part not in current:
-                    current[path_part] = {}
-                current = current[path_part]
-            
-            # Set value at path
-            current[path[-1]] = param_value
+            # Regular parameter - set in metadata, creating its path on first use
+            _parent_dict(parent_cache, spec.parents)[spec.leaf] = param_value
+    
+    # Add Power Lora and Multi-LoRA Loader LoRAs to metadata if found
+    if power_loras or multi_loras:
+        _parent_dict(parent_cache, ("ai_info", "generation"))["loras"] = power_loras + multi_loras
     
     # Process LoRAs after all nodes
     if lora_nodes:
@@ -477,32 +533,13 @@ def resolve_reference(ref_value, nodes):
     ref_node = nodes[str(node_id)]
     node_type = ref_node.get('class_type', '')
     
-    # Handle common value-type nodes
-    if node_type == 'PrimitiveNode' and 'value' in ref_node.get('inputs', {}):
-        return ref_node['inputs']['value']
-        
-    if node_type == 'StringNode' and 'string' in ref_node.get('inputs', {}):
-        return ref_node['inputs']['string']
-        
-    # Handle Text Multiline nodes (commonly used for prompts)
-    if node_type == 'Text Multiline' and 'text' in ref_node.get('inputs', {}):
-        return ref_node['inputs']['text']
-        
-    if node_type == 'TextMultiline' and 'text' in ref_node.get('inputs', {}):
-        return ref_node['inputs']['text']
-        
-    if node_type == 'String' and 'String' in ref_node.get('inputs', {}):
-        return ref_node['inputs']['String']
-        
-    if node_type == 'String' and 'string' in ref_node.get('inputs', {}):
-        return ref_node['inputs']['string']
-        
-    # Handle specific nodes we recognize
-    if node_type == 'SamplerNode' and 'sampler_name' in ref_node.get('inputs', {}):
-        return ref_node['inputs']['sampler_name']
-        
-    if node_type == 'SchedulerNode' and 'scheduler' in ref_node.get('inputs', {}):
-        return ref_node['inputs']['scheduler']
+    # Handle value-type nodes (primitives, text/string nodes, samplers)
+    input_keys = REF_RESOLVERS.get(node_type)
+    if input_keys:
+        inputs = ref_node.get('inputs', {})
+        for key in input_keys:
+            if key in inputs:
+                return inputs[key]
     
     # Return the node type as fallback
     return node_type